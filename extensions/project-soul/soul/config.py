@@ -5,9 +5,12 @@ Configuration management for Project Soul
 import os
 from pathlib import Path
 from typing import Optional, Dict, Any
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, asdict
 import yaml
 
+# Prefer the libyaml-backed dumper when PyYAML was built with it
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 @dataclass
 class MoshiConfig:
@@ -38,6 +41,7 @@ class SuperGooseConfig:
     cli_path: str = "super-goose"
     working_directory: str = "."
     event_server: str = "ws://localhost:8080/events"
+    max_concurrent_tasks: int = 16
     agents: Dict[str, bool] = field(default_factory=lambda: {
         "architect": True,
         "coder": True,
@@ -138,56 +142,12 @@ class SoulConfig:
         """Save configuration to YAML file"""
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        data = {
-            "user_id": self.user_id,
-            "language": self.language,
-            "wake_word": self.wake_word,
-            "moshi": {
-                "model_path": self.moshi.model_path,
-                "device": self.moshi.device,
-                "sample_rate": self.moshi.sample_rate,
-                "chunk_size": self.moshi.chunk_size,
-                "latency_target_ms": self.moshi.latency_target_ms,
-                "enable_duplex": self.moshi.enable_duplex,
-                "emotion_modulation": self.moshi.emotion_modulation,
-            },
-            "memory": {
-                "vector_store": self.memory.vector_store,
-                "embedding_model": self.memory.embedding_model,
-                "storage_path": self.memory.storage_path,
-                "max_memories": self.memory.max_memories,
-                "search_limit": self.memory.search_limit,
-                "enable_encryption": self.memory.enable_encryption,
-            },
-            "super_goose": {
-                "cli_path": self.super_goose.cli_path,
-                "working_directory": self.super_goose.working_directory,
-                "event_server": self.super_goose.event_server,
-                "agents": self.super_goose.agents,
-                "notifications": self.super_goose.notifications,
-            },
-            "orb": {
-                "enabled": self.orb.enabled,
-                "size": list(self.orb.size),
-                "position": self.orb.position,
-                "opacity": self.orb.opacity,
-                "fps": self.orb.fps,
-                "colors": self.orb.colors,
-            },
-            "emotion": {
-                "enable_detection": self.emotion.enable_detection,
-                "enable_response": self.emotion.enable_response,
-                "sensitivity": self.emotion.sensitivity,
-                "emotions": self.emotion.emotions,
-            },
-            "log_level": self.log_level,
-            "log_path": self.log_path,
-            "backup_enabled": self.backup_enabled,
-            "backup_frequency": self.backup_frequency,
-        }
+        data = asdict(self)
+        # Tuples are not representable by the safe dumper
+        data["orb"]["size"] = list(self.orb.size)
 
         with open(path, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(data, f, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False)
 
     @property
     def soul_dir(self) -> Path:
@@ -205,6 +165,10 @@ class SoulConfig:
         ]
 
         for dir_path in dirs:
+            # One stat on the common already-set-up path; mkdir(parents=True)
+            # would otherwise walk and stat every parent directory.
+            if dir_path.is_dir():
+                continue
             dir_path.mkdir(parents=True, exist_ok=True)
 
 
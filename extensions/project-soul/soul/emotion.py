@@ -11,7 +11,24 @@ from .moshi_client import AudioParams
 from .liaison import TaskResult
 
 
-@dataclass
+# Outcome-specific responses that override the configured emotion table
+_DEFAULT_PARAMS = AudioParams()
+_SUPPORTIVE_PARAMS = AudioParams(tone="supportive")
+_FRUSTRATED_FAIL_PARAMS = AudioParams(
+    tone="empathetic",
+    speed=0.85,
+    pitch=0.95,
+    add_pause=True,
+)
+_EXCITED_SUCCESS_PARAMS = AudioParams(
+    tone="enthusiastic",
+    speed=1.15,
+    pitch=1.1,
+    add_laughter=True,
+)
+
+
+@dataclass(slots=True)
 class Emotion:
     """Detected emotion state"""
     name: str  # "frustrated", "excited", "confused", etc.
@@ -31,6 +48,17 @@ class EmotionEngine:
 
     def __init__(self, config: EmotionConfig):
         self.config = config
+        # Configured emotion -> response parameters, resolved once
+        self._emotion_params: Dict[str, AudioParams] = {
+            name: AudioParams(
+                tone="supportive",
+                speed=cfg.get("speed", 1.0),
+                pitch=cfg.get("pitch", 1.0),
+                add_pause=cfg.get("add_pause", False),
+                add_laughter=cfg.get("add_laughter", False),
+            )
+            for name, cfg in config.emotions.items()
+        }
         logger.info("Initializing emotion engine")
         logger.warning(
             "⚠️  Emotion detection is not yet implemented. "
@@ -84,40 +112,18 @@ class EmotionEngine:
         4. Celebrate successes appropriately
         """
         if not self.config.enable_response:
-            return AudioParams()
-
-        # Get emotion config
-        emotion_config = self.config.emotions.get(
-            user_emotion.name,
-            {"speed": 1.0, "pitch": 1.0, "add_pause": False}
-        )
+            return _DEFAULT_PARAMS
 
         # Adjust based on task result
         if not result.success and user_emotion.name == "frustrated":
             # User is frustrated and task failed - be extra calm
-            return AudioParams(
-                tone="empathetic",
-                speed=0.85,
-                pitch=0.95,
-                add_pause=True,
-            )
+            return _FRUSTRATED_FAIL_PARAMS
         elif result.success and user_emotion.name == "excited":
             # User is excited and task succeeded - celebrate!
-            return AudioParams(
-                tone="enthusiastic",
-                speed=1.15,
-                pitch=1.1,
-                add_laughter=True,
-            )
+            return _EXCITED_SUCCESS_PARAMS
         else:
             # Use configured emotion response
-            return AudioParams(
-                tone="supportive",
-                speed=emotion_config.get("speed", 1.0),
-                pitch=emotion_config.get("pitch", 1.0),
-                add_pause=emotion_config.get("add_pause", False),
-                add_laughter=emotion_config.get("add_laughter", False),
-            )
+            return self._emotion_params.get(user_emotion.name, _SUPPORTIVE_PARAMS)
 
     def _extract_prosody(self, audio: bytes) -> Dict[str, float]:
         """
@@ -3,8 +3,11 @@ Liaison between Soul and Super-Goose - translates intent to tasks
 """
 
 import asyncio
-import subprocess
-from typing import Optional, List, Dict, Any
+import re
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from typing import Optional, List, Dict, Any, Tuple, Deque, Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from loguru import logger
@@ -13,7 +16,11 @@ from .config import SuperGooseConfig
 from .memory import Memory
 
 
-@dataclass
+# Same result as `"test" in intent.lower()` without copying the intent
+_TEST_KEYWORD_RE = re.compile("test", re.IGNORECASE | re.ASCII)
+
+
+@dataclass(frozen=True, slots=True)
 class Task:
     """A task to be executed by Super-Goose"""
     id: str
@@ -32,7 +39,7 @@ class Task:
         }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TaskResult:
     """Result from task execution"""
     task_id: str
@@ -60,7 +67,10 @@ class SuperGooseLiaison:
     def __init__(self, config: SuperGooseConfig):
         self.config = config
         self.working_dir = Path(config.working_directory).expanduser().resolve()
-        self.active_tasks: Dict[str, Task] = {}
+        # Insertion-ordered so the oldest task is evicted when at capacity
+        self.active_tasks: "OrderedDict[str, Task]" = OrderedDict()
+        # Wall-clock seconds of recently finished tasks (for pattern checks)
+        self.task_durations: Deque[float] = deque(maxlen=1000)
 
         logger.info(f"Liaison initialized for: {self.working_dir}")
 
@@ -88,10 +98,10 @@ class SuperGooseLiaison:
         # 3. Apply user preferences from memories
         # 4. Generate structured task
 
-        logger.debug(f"Parsing intent: {intent[:100]}...")
+        logger.debug("Parsing intent: {}...", intent[:100])
 
         # Placeholder: detect some keywords
-        if "test" in intent.lower():
+        if _TEST_KEYWORD_RE.search(intent):
             return Task(
                 id=f"task_{len(self.active_tasks)}",
                 type="test",
@@ -114,39 +124,60 @@ class SuperGooseLiaison:
         """
         logger.info(f"Executing task {task.id}: {task.type} {task.target}")
 
-        self.active_tasks[task.id] = task
+        with self._register_task(task):
+            try:
+                # TODO: Implement actual Super-Goose integration
+                # This should:
+                # 1. Generate PLAN.md from task
+                # 2. Execute via super-goose CLI
+                # 3. Monitor progress via WebSocket events
+                # 4. Handle errors and retries
+
+                # Placeholder: simulate execution
+                await asyncio.sleep(1)
+
+                result = TaskResult(
+                    task_id=task.id,
+                    success=True,
+                    message=f"Task {task.type} completed successfully",
+                    details={"output": "placeholder"},
+                )
+
+            except Exception as e:
+                logger.error(f"Task {task.id} failed: {e}")
+                result = TaskResult(
+                    task_id=task.id,
+                    success=False,
+                    message=f"Task failed: {str(e)}",
+                    details={"error": str(e)},
+                )
 
-        try:
-            # TODO: Implement actual Super-Goose integration
-            # This should:
-            # 1. Generate PLAN.md from task
-            # 2. Execute via super-goose CLI
-            # 3. Monitor progress via WebSocket events
-            # 4. Handle errors and retries
-
-            # Placeholder: simulate execution
-            await asyncio.sleep(1)
-
-            result = TaskResult(
-                task_id=task.id,
-                success=True,
-                message=f"Task {task.type} completed successfully",
-                details={"output": "placeholder"},
-            )
+        return result
 
-        except Exception as e:
-            logger.error(f"Task {task.id} failed: {e}")
-            result = TaskResult(
-                task_id=task.id,
-                success=False,
-                message=f"Task failed: {str(e)}",
-                details={"error": str(e)},
-            )
+    @contextmanager
+    def _register_task(self, task: Task) -> Iterator[None]:
+        """
+        Track a task as active for the duration of the block
+
+        Evicts the oldest active task when at capacity, and records how
+        long the task ran once the block exits (success or failure).
 
+        Args:
+            task: Task being executed
+        """
+        if len(self.active_tasks) >= self.config.max_concurrent_tasks:
+            oldest_id, _ = self.active_tasks.popitem(last=False)
+            logger.warning(
+                f"Too many active tasks ({self.config.max_concurrent_tasks}); "
+                f"dropping oldest: {oldest_id}"
+            )
+        self.active_tasks[task.id] = task
+        start = time.monotonic()
+        try:
+            yield
         finally:
             self.active_tasks.pop(task.id, None)
-
-        return result
+            self.task_durations.append(time.monotonic() - start)
 
     async def proactive_suggestion(self) -> Optional[str]:
         """
@@ -165,26 +196,27 @@ class SuperGooseLiaison:
         # Placeholder
         return None
 
-    def _execute_command(self, command: List[str]) -> subprocess.CompletedProcess:
+    async def _execute_command(self, command: List[str]) -> Tuple[int, bytes, bytes]:
         """
-        Execute Super-Goose command
+        Execute Super-Goose command without blocking the event loop
 
         Args:
             command: Command and arguments
 
         Returns:
-            CompletedProcess result
+            Tuple of (returncode, stdout, stderr)
         """
-        logger.debug(f"Executing: {' '.join(command)}")
+        logger.opt(lazy=True).debug("Executing: {}", lambda: " ".join(command))
 
-        result = subprocess.run(
-            command,
-            cwd=self.working_dir,
-            capture_output=True,
-            text=True,
+        proc = await asyncio.create_subprocess_exec(
+            *command,
+            cwd=str(self.working_dir),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
         )
+        stdout, stderr = await proc.communicate()
 
-        return result
+        return proc.returncode, stdout, stderr
 
     async def _generate_plan(self, task: Task) -> str:
         """
@@ -234,9 +266,9 @@ Constraints: {task.constraints}
         logger.info("Closing liaison")
 
         # Cancel active tasks
-        for task_id in list(self.active_tasks.keys()):
+        for task_id in self.active_tasks:
             logger.warning(f"Cancelling active task: {task_id}")
-            self.active_tasks.pop(task_id, None)
+        self.active_tasks.clear()
 
 
 # Future implementation notes:
@@ -244,7 +276,6 @@ Constraints: {task.constraints}
 Full Super-Goose integration will look like:
 
 import websockets
-import subprocess
 from pathlib import Path
 
 class SuperGooseLiaison:
@@ -255,7 +286,7 @@ class SuperGooseLiaison:
         plan_path.write_text(plan)
 
         # Execute via CLI
-        result = self._execute_command([
+        returncode, stdout, stderr = await self._execute_command([
             self.config.cli_path,
             "execute",
             "--plan", str(plan_path)
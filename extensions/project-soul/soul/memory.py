@@ -12,7 +12,7 @@ from loguru import logger
 from .config import MemoryConfig
 
 
-@dataclass
+@dataclass(slots=True)
 class Memory:
     """A single memory entry"""
     id: str
@@ -71,7 +71,7 @@ class SoulMemory:
         # 3. Store in vector database
         # 4. Update knowledge graph
 
-        logger.debug(f"Storing memory: {conversation.get('user_input', '')[:50]}...")
+        logger.debug("Storing memory: {}...", conversation.get("user_input", "")[:50])
 
     async def recall(self, query: str) -> List[Memory]:
         """
@@ -90,7 +90,7 @@ class SoulMemory:
         # 3. Rank by relevance
         # 4. Return top N results
 
-        logger.debug(f"Recalling memories for: {query[:50]}...")
+        logger.debug("Recalling memories for: {}...", query[:50])
         return []
 
     async def get_preferences(self, category: Optional[str] = None) -> Dict[str, Any]:
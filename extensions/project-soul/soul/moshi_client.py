@@ -10,9 +10,9 @@ from loguru import logger
 from .config import MoshiConfig
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AudioParams:
-    """Parameters for audio output modulation"""
+    """Parameters for audio output modulation (immutable, safe to share)"""
     tone: str = "neutral"
     speed: float = 1.0
     pitch: float = 1.0
@@ -34,6 +34,8 @@ class MoshiClient:
         self.config = config
         self.is_listening = False
         self.is_speaking = False
+        # Simulated seconds of speech per character at speed 1.0
+        self._char_duration = 0.05
 
         logger.info(f"Initializing Moshi on {config.device}")
         logger.warning(
@@ -102,7 +104,8 @@ class MoshiClient:
         # 4. Support interruption
 
         self.is_speaking = True
-        await asyncio.sleep(len(message) * 0.05)  # Simulate speaking time
+        # Simulate speaking time; faster speech finishes sooner
+        await asyncio.sleep(len(message) * (self._char_duration / params.speed))
         self.is_speaking = False
 
     def interrupt(self) -> None:
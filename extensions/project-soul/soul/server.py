@@ -4,7 +4,7 @@ Main Soul server - coordinates all components
 
 import asyncio
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Dict, Any
 from loguru import logger
 
 from .config import SoulConfig
@@ -13,10 +13,25 @@ from .memory import SoulMemory
 from .liaison import SuperGooseLiaison
 from .emotion import EmotionEngine
 
+# Main loop error backoff (seconds): doubles per consecutive failure up to the cap
+ERROR_BACKOFF_INITIAL = 0.1
+ERROR_BACKOFF_MAX = 30.0
+
 
 class SoulServer:
     """Main Soul server orchestrating all components"""
 
+    __slots__ = (
+        "config",
+        "running",
+        "moshi",
+        "memory",
+        "liaison",
+        "emotion",
+        "_memory_queue",
+        "_memory_flusher",
+    )
+
     def __init__(self, config: Optional[SoulConfig] = None):
         self.config = config or SoulConfig()
         self.running = False
@@ -27,8 +42,9 @@ class SoulServer:
         self.liaison: Optional[SuperGooseLiaison] = None
         self.emotion: Optional[EmotionEngine] = None
 
-        # Setup logging
-        self._setup_logging()
+        # Conversations waiting to be written to memory
+        self._memory_queue: Optional["asyncio.Queue[Dict[str, Any]]"] = None
+        self._memory_flusher: Optional[asyncio.Task] = None
 
     def _setup_logging(self) -> None:
         """Configure logging"""
@@ -40,15 +56,18 @@ class SoulServer:
             rotation="1 day",
             retention="30 days",
             level=self.config.log_level,
+            enqueue=True,  # Write/rotate on loguru's worker thread, not the event loop
         )
 
     async def start(self) -> None:
         """Start Soul server and all components"""
+        # Directory creation and log sink setup touch the filesystem
+        await asyncio.to_thread(self._setup_logging)
         logger.info("🌌 Starting Project Soul...")
 
         try:
             # Setup directories
-            self.config.setup_directories()
+            await asyncio.to_thread(self.config.setup_directories)
 
             # Initialize components
             logger.info("Initializing Moshi voice engine...")
@@ -57,6 +76,8 @@ class SoulServer:
             logger.info("Initializing memory system...")
             self.memory = SoulMemory(self.config.memory, self.config.user_id)
             await self.memory.initialize()
+            self._memory_queue = asyncio.Queue()
+            self._memory_flusher = asyncio.create_task(self._flush_memory())
 
             logger.info("Initializing Super-Goose liaison...")
             self.liaison = SuperGooseLiaison(self.config.super_goose)
@@ -73,7 +94,7 @@ class SoulServer:
         except KeyboardInterrupt:
             logger.info("Received shutdown signal")
         except Exception as e:
-            logger.error(f"Fatal error: {e}", exc_info=True)
+            logger.opt(exception=True).error("Fatal error: {}", e)
         finally:
             await self.stop()
 
@@ -82,6 +103,12 @@ class SoulServer:
         logger.info("Shutting down Soul...")
         self.running = False
 
+        # Let queued memory writes land before the memory system closes
+        if self._memory_flusher:
+            if not self._memory_flusher.done():
+                await self._memory_queue.join()
+            self._memory_flusher.cancel()
+
         if self.moshi:
             await self.moshi.close()
 
@@ -97,21 +124,32 @@ class SoulServer:
         """Main processing loop"""
         logger.info("Entering main loop...")
 
+        backoff = ERROR_BACKOFF_INITIAL
         while self.running:
             try:
                 # Listen for user input
                 audio_input = await self.moshi.listen()
 
                 if audio_input:
-                    # Detect emotion from voice
-                    user_emotion = await self.emotion.detect_user_emotion(audio_input)
-                    logger.debug(f"User emotion: {user_emotion}")
+                    # Detect emotion from voice in the background; only the
+                    # response modulation below needs it
+                    emotion_task = asyncio.create_task(
+                        self.emotion.detect_user_emotion(audio_input)
+                    )
 
                     # Process through Moshi (speech-to-speech)
-                    intent, context = await self.moshi.process(audio_input)
-
-                    # Retrieve relevant memories
-                    memories = await self.memory.recall(context)
+                    try:
+                        intent, context = await self.moshi.process(audio_input)
+                    except BaseException:
+                        emotion_task.cancel()
+                        raise
+
+                    # Retrieve relevant memories while emotion detection finishes
+                    user_emotion, memories = await asyncio.gather(
+                        emotion_task,
+                        self.memory.recall(context),
+                    )
+                    logger.debug("User emotion: {}", user_emotion)
 
                     # Parse intent and generate task
                     task = await self.liaison.parse_intent(
@@ -133,8 +171,9 @@ class SoulServer:
                         # Speak response
                         await self.moshi.speak(result.message, response_params)
 
-                        # Store conversation in memory
-                        await self.memory.remember({
+                        # Queue conversation for memory without holding up
+                        # the next listen cycle
+                        self._memory_queue.put_nowait({
                             "user_input": intent,
                             "soul_response": result.message,
                             "emotion": user_emotion,
@@ -142,11 +181,26 @@ class SoulServer:
                             "result": result.to_dict(),
                         })
 
-                await asyncio.sleep(0.01)  # Small sleep to prevent tight loop
+                backoff = ERROR_BACKOFF_INITIAL
 
             except Exception as e:
-                logger.error(f"Error in main loop: {e}", exc_info=True)
-                await asyncio.sleep(1)  # Back off on error
+                logger.opt(exception=True).error(
+                    "Error in main loop: {} (retrying in {:.1f}s)", e, backoff
+                )
+                await asyncio.sleep(backoff)  # Back off harder while the fault persists
+                backoff = min(backoff * 2, ERROR_BACKOFF_MAX)
+
+    async def _flush_memory(self) -> None:
+        """Background task: write queued conversations to memory"""
+        queue = self._memory_queue
+        while True:
+            conversation = await queue.get()
+            try:
+                await self.memory.remember(conversation)
+            except Exception:
+                logger.opt(exception=True).error("Failed to store memory")
+            finally:
+                queue.task_done()
 
     async def proactive_check(self) -> None:
         """Check for proactive suggestions (called periodically)"""
@@ -172,5 +226,16 @@ async def run_soul(config_path: Optional[Path] = None) -> None:
     await server.start()
 
 
+def _install_uvloop() -> None:
+    """Use uvloop's event loop when it is installed (not available on Windows)"""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("Using uvloop event loop")
+
+
 if __name__ == "__main__":
+    _install_uvloop()
     asyncio.run(run_soul())
@@ -14,11 +14,15 @@ Tools are registered in config/external_tools.toml and discovered
 at startup by the ToolRegistry.
 """
 
+import importlib
+import os
 from pathlib import Path
 
-INTEGRATIONS_DIR = Path(__file__).parent
-CONFIG_DIR = INTEGRATIONS_DIR.parent.parent / "config"
-EXTERNAL_DIR = INTEGRATIONS_DIR.parent.parent.parent  # G:\goose\external\
+# Resolved once with plain string ops; each constant builds a single Path
+_HERE = os.path.dirname(os.path.abspath(__file__))
+INTEGRATIONS_DIR = Path(_HERE)
+CONFIG_DIR = Path(os.path.normpath(os.path.join(_HERE, "..", "..", "config")))
+EXTERNAL_DIR = Path(os.path.normpath(os.path.join(_HERE, "..", "..", "..")))  # G:\goose\external\
 
 __all__ = [
     # Stage 5.5 — Wired
@@ -44,3 +48,20 @@ __all__ = [
     "crosshair_bridge",
     "pr_agent_bridge",
 ]
+
+
+def __getattr__(name: str):
+    """Import bridge submodules on first attribute access (PEP 562).
+
+    Each bridge pulls in its own heavy dependency tree, so nothing is
+    imported until a caller actually references it.
+    """
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
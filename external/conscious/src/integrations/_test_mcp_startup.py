@@ -41,6 +41,10 @@ print(f"OK ({len(tool_names)} tools)")
 print("Test 4: Handle initialize request...", end=" ")
 import asyncio
 
+# One event loop for all handler tests instead of a fresh one per asyncio.run
+loop = asyncio.new_event_loop()
+asyncio.set_event_loop(loop)
+
 async def test_initialize():
     msg = {
         "jsonrpc": "2.0",
@@ -62,7 +66,7 @@ async def test_initialize():
     assert result["serverInfo"]["name"] == "aider-mcp"
     return response
 
-resp = asyncio.run(test_initialize())
+resp = loop.run_until_complete(test_initialize())
 print("OK")
 print(f"  Response: {json.dumps(resp, indent=2)}")
 
@@ -78,7 +82,7 @@ async def test_tools_list():
     assert len(tools) == 5
     return response
 
-resp = asyncio.run(test_tools_list())
+resp = loop.run_until_complete(test_tools_list())
 print("OK")
 
 # Test 6: Handle aider_strategies tool call
@@ -101,7 +105,7 @@ async def test_strategies():
     assert content["default"] == "diff"
     return content
 
-content = asyncio.run(test_strategies())
+content = loop.run_until_complete(test_strategies())
 print(f"OK ({content['count']} strategies, default={content['default']})")
 
 # Test 7: Handle notifications/initialized (should return None)
@@ -112,7 +116,7 @@ async def test_notification():
     response = await aider_mcp_server._handle_message(msg)
     assert response is None, "Notification should return None"
 
-asyncio.run(test_notification())
+loop.run_until_complete(test_notification())
 print("OK (no response, as expected)")
 
 # Test 8: Handle unknown tool
@@ -131,7 +135,7 @@ async def test_unknown_tool():
     assert response["error"]["code"] == -32601
     return response
 
-resp = asyncio.run(test_unknown_tool())
+resp = loop.run_until_complete(test_unknown_tool())
 print("OK (error returned correctly)")
 
 # Test 9: Handle ping
@@ -144,11 +148,188 @@ async def test_ping():
     assert response["id"] == 5
     assert "result" in response
 
-asyncio.run(test_ping())
+loop.run_until_complete(test_ping())
+print("OK")
+
+# Test 10: execute_batch serializes repo writes and parallelizes reads
+print("Test 10: execute_batch write/read ordering...", end=" ")
+aider_bridge = aider_mcp_server.aider_bridge
+
+def _tracking_operation(peaks, name):
+    """Fake bridge operation recording its peak concurrency in *peaks*."""
+    async def operation(**params):
+        peaks["active"] += 1
+        peaks[name] = max(peaks.get(name, 0), peaks["active"])
+        await asyncio.sleep(0.02)
+        peaks["active"] -= 1
+        return {"success": True, "output": "", "error": None}
+    return operation
+
+async def test_batch_ordering():
+    peaks = {"active": 0}
+    saved = dict(aider_bridge._ASYNC_OPERATIONS)
+    aider_bridge._ASYNC_OPERATIONS["edit_file"] = _tracking_operation(peaks, "edit_file")
+    aider_bridge._ASYNC_OPERATIONS["map_repo"] = _tracking_operation(peaks, "map_repo")
+    try:
+        writes = await aider_bridge.execute_batch("edit_file", [{}] * 3)
+        reads = await aider_bridge.execute_batch("map_repo", [{}] * 3)
+    finally:
+        aider_bridge._ASYNC_OPERATIONS.clear()
+        aider_bridge._ASYNC_OPERATIONS.update(saved)
+    assert all(r["success"] for r in writes + reads)
+    assert peaks["edit_file"] == 1, f"writes overlapped: {peaks}"
+    assert peaks["map_repo"] == 3, f"reads did not overlap: {peaks}"
+
+loop.run_until_complete(test_batch_ordering())
+print("OK")
+
+# Test 11: a repo-write lock timeout is reported, not run uncoordinated
+print("Test 11: repo-write lock timeout...", end=" ")
+
+async def test_lock_timeout():
+    coordinator = aider_bridge.get_coordinator()
+    ran = []
+
+    async def edit_file(**params):
+        ran.append(params)
+        return {"success": True, "output": "", "error": None}
+
+    acquire = coordinator.acquire_resources
+    saved = aider_bridge._ASYNC_OPERATIONS["edit_file"]
+    aider_bridge._ASYNC_OPERATIONS["edit_file"] = edit_file
+    coordinator.acquire_resources = (
+        lambda tool, operation: acquire(tool, operation, timeout=0.05)
+    )
+    assert await coordinator._repo_lock.acquire_write("test-holder")
+    try:
+        result = await aider_bridge.execute("edit_file", {})
+    finally:
+        await coordinator._repo_lock.release_write()
+        del coordinator.acquire_resources
+        aider_bridge._ASYNC_OPERATIONS["edit_file"] = saved
+    assert result["success"] is False, result
+    assert "Could not acquire resources" in result["error"]
+    assert not ran, "edit ran without holding the repo lock"
+
+loop.run_until_complete(test_lock_timeout())
+print("OK")
+
+# Test 12: map_repo cache is invalidated by unstaged worktree edits
+print("Test 12: map_repo cache invalidation...", end=" ")
+import subprocess
+import tempfile
+
+async def test_map_repo_invalidation():
+    calls = []
+
+    async def map_repo(**params):
+        calls.append(params)
+        return {"success": True, "output": f"map {len(calls)}", "error": None}
+
+    saved = aider_bridge.map_repo
+    aider_bridge.map_repo = map_repo
+    aider_mcp_server._map_repo_cache.clear()
+    try:
+        with tempfile.TemporaryDirectory() as repo:
+            source = os.path.join(repo, "a.py")
+            with open(source, "w") as f:
+                f.write("x = 1\n")
+            git = ["git", "-C", repo, "-c", "user.name=t", "-c", "user.email=t@t"]
+            subprocess.run(git[:3] + ["init", "-q"], check=True)
+            subprocess.run(git + ["add", "a.py"], check=True)
+            subprocess.run(git + ["commit", "-qm", "init"], check=True)
+
+            await aider_mcp_server._map_repo_cached(repo, 1024, None)
+            await aider_mcp_server._map_repo_cached(repo, 1024, None)
+            assert len(calls) == 1, "unchanged worktree should hit the cache"
+
+            for body in ("x = 2\n", "x = 33\n"):  # dirty, then dirty again
+                with open(source, "w") as f:
+                    f.write(body)
+                await aider_mcp_server._map_repo_cached(repo, 1024, None)
+            assert len(calls) == 3, f"edits did not invalidate: {len(calls)} calls"
+
+        with tempfile.TemporaryDirectory() as plain:
+            await aider_mcp_server._map_repo_cached(plain, 1024, None)
+            await aider_mcp_server._map_repo_cached(plain, 1024, None)
+            assert len(calls) == 5, "non-git directories must not be cached"
+    finally:
+        aider_bridge.map_repo = saved
+        aider_mcp_server._map_repo_cache.clear()
+
+loop.run_until_complete(test_map_repo_invalidation())
+print("OK")
+
+# Test 13: tools/call argument validation (fastjsonschema and built-in check)
+print("Test 13: tools/call argument validation...", end=" ")
+
+def _check_both(tool_name, arguments):
+    """Return the (active validator, built-in check) messages for *arguments*."""
+    schema = aider_mcp_server._TOOLS_BY_NAME[tool_name]["inputSchema"]
+    # fastjsonschema fills in defaults, so each check gets its own copy
+    copy = dict if isinstance(arguments, dict) else (lambda value: value)
+    active = aider_mcp_server._ARG_VALIDATORS[tool_name](copy(arguments))
+    builtin = aider_mcp_server._check_arguments(schema, copy(arguments))
+    return active, builtin
+
+for tool_name, arguments in [
+    ("aider_map_repo", {"directory": "."}),
+    ("aider_map_repo", {"directory": ".", "model": None, "map_tokens": None}),
+    ("aider_edit", {"file_path": "a.py", "instruction": "x", "strategy": None,
+                    "model": "gpt-4o", "auto_commit": None}),
+    ("aider_commit", {"repo_path": ".", "message": None}),
+    ("aider_lint", {"file_path": "a.py", "lint_cmd": None, "auto_commit": True}),
+]:
+    assert _check_both(tool_name, arguments) == (None, None), (tool_name, arguments)
+
+for tool_name, arguments in [
+    ("aider_map_repo", {}),
+    ("aider_map_repo", {"directory": 3}),
+    ("aider_map_repo", {"directory": ".", "map_tokens": "many"}),
+    ("aider_map_repo", {"directory": ".", "map_tokens": True}),
+    ("aider_edit", {"file_path": "a.py", "instruction": "x", "auto_commit": "yes"}),
+    ("aider_commit", None),
+]:
+    active, builtin = _check_both(tool_name, arguments)
+    assert active and builtin, (tool_name, arguments, active, builtin)
+
+async def test_invalid_arguments():
+    msg = {
+        "jsonrpc": "2.0",
+        "id": 6,
+        "method": "tools/call",
+        "params": {"name": "aider_map_repo", "arguments": {"directory": 3}},
+    }
+    response = await aider_mcp_server._handle_message(msg)
+    assert response["error"]["code"] == aider_mcp_server.INVALID_PARAMS_CODE
+
+loop.run_until_complete(test_invalid_arguments())
 print("OK")
 
-# Test 10: Verify FastMCP status
-print(f"Test 10: FastMCP available: {aider_mcp_server._USE_FASTMCP}")
+# Test 14: "arguments": null is treated like an empty arguments object
+print("Test 14: tools/call with null arguments...", end=" ")
+
+async def test_null_arguments():
+    msg = {
+        "jsonrpc": "2.0",
+        "id": 7,
+        "method": "tools/call",
+        "params": {"name": "aider_strategies", "arguments": None},
+    }
+    response = await aider_mcp_server._handle_message(msg)
+    assert response["result"]["isError"] is False
+    msg["params"] = {"name": "aider_map_repo", "arguments": None}
+    response = await aider_mcp_server._handle_message(msg)
+    assert response["error"]["code"] == aider_mcp_server.INVALID_PARAMS_CODE
+    assert aider_mcp_server._EMPTY_DICT == {}
+
+loop.run_until_complete(test_null_arguments())
+print("OK")
+
+loop.close()
+
+# Test 15: Verify FastMCP status
+print(f"Test 15: FastMCP available: {aider_mcp_server._USE_FASTMCP}")
 
 print()
 print("=" * 50)
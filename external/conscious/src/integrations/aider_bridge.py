@@ -19,6 +19,7 @@ Bridge operations:
     init            - Lazy initialization and validation
     capabilities    - List supported operations
     execute         - Unified dispatch for the ToolRegistry
+    execute_batch   - Run one operation over many parameter sets concurrently
 
 Configuration is read from config/external_tools.toml under [tools.aider].
 
@@ -29,9 +30,14 @@ Reference:
 """
 
 import asyncio
+import hashlib
+import importlib.metadata
+import json
 import logging
 import os
+import shlex
 import shutil
+import signal
 import subprocess
 import sys
 import threading
@@ -41,7 +47,12 @@ from typing import Any, Optional
 # Import ToolStatus from the registry to maintain a consistent interface
 # across all bridge modules.
 from integrations.registry import ToolStatus
-from integrations.resource_coordinator import get_coordinator
+from integrations.resource_coordinator import (
+    TOOL_RESOURCES,
+    ResourceCoordinatorError,
+    ResourceId,
+    get_coordinator,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -71,6 +82,9 @@ EDIT_STRATEGIES: dict[str, str] = {
     "whole":              "Whole-file replacement (safest, highest token cost)",
 }
 
+# Strategy names as listed in "invalid strategy" errors
+_EDIT_STRATEGY_NAMES = ", ".join(sorted(EDIT_STRATEGIES))
+
 # Default edit strategy when none is specified
 DEFAULT_EDIT_STRATEGY = "diff"
 
@@ -83,6 +97,50 @@ EDIT_TIMEOUT = 300      # 5 minutes -- LLM calls can be slow
 MAP_TIMEOUT = 120       # 2 minutes -- tree-sitter parsing
 COMMIT_TIMEOUT = 60     # 1 minute  -- git operations
 LINT_TIMEOUT = 120      # 2 minutes -- linting + auto-fix
+TERMINATE_GRACE = 2     # SIGTERM -> SIGKILL grace on timeout
+
+# Most stdout kept from one Aider run; the process is stopped past this
+MAX_OUTPUT_BYTES = 4 * 1024 * 1024
+
+# Most Aider subprocesses allowed to run concurrently (at least 1)
+try:
+    MAX_PARALLEL = max(1, int(os.environ.get("AIDER_MAX_PARALLEL", "4")))
+except ValueError:
+    logger.warning("Ignoring non-integer AIDER_MAX_PARALLEL; using 4")
+    MAX_PARALLEL = 4
+
+# Run Aider in its own process group so a timeout can stop the children it
+# spawns (linters, LiteLLM workers) along with it
+_SPAWN_KWARGS: dict[str, Any] = (
+    {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    if sys.platform == "win32"
+    else {"start_new_session": True}
+)
+
+# Variables layered over the inherited environment for every Aider subprocess
+_AIDER_ENV_OVERRIDES: dict[str, str] = {
+    "AIDER_YES": "true",
+    "PYTHONUNBUFFERED": "1",
+    # Prevent Aider from launching a browser or interactive prompts
+    "AIDER_NO_GUI": "true",
+}
+
+# Result template for operations attempted without a usable Aider install
+_ERROR_NOT_INSTALLED: dict[str, Any] = {
+    "success": False,
+    "output": "",
+    "error": (
+        "Aider is not installed or not found on PATH. "
+        f"Install with: pip install -e {AIDER_ROOT}"
+    ),
+}
+
+# Executable string recorded when Aider is run from the local tree
+_MODULE_INVOCATION = f"{sys.executable} -m aider"
+
+# Resolved executable/version from a previous process, reused while PATH,
+# the local Aider tree and the interpreter are unchanged
+DISCOVERY_CACHE_PATH = Path.home() / ".cache" / "goose" / "aider_bridge.json"
 
 # ---------------------------------------------------------------------------
 # Module-level state (lazy init)
@@ -92,6 +150,42 @@ _initialized: bool = False
 _init_lock = threading.Lock()
 _aider_executable: Optional[str] = None
 _aider_version: Optional[str] = None
+_aider_cmd_prefix: tuple[str, ...] = ()
+_init_result: Optional[dict[str, Any]] = None  # shared; callers must not mutate
+_aider_env: Optional[dict[str, str]] = None  # shared; callers must not mutate
+_aider_env_source: Optional[dict] = None  # os.environ contents it was built from
+_spawn_sem: Optional[asyncio.Semaphore] = None
+_spawn_sem_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def install_pidfd_child_watcher() -> None:
+    """
+    Reap subprocesses via pidfds on the event loop (Linux, Python < 3.12).
+
+    The default ``ThreadedChildWatcher`` starts one ``waitpid`` thread per
+    subprocess; ``PidfdChildWatcher`` waits on a pidfd per child from the
+    loop's selector instead.  This is a process-wide policy setting and the
+    watcher is only attached to loops set in the main thread, after which
+    subprocesses started from worker-thread loops fail.  It is therefore
+    opt-in: call it only from a single-loop, main-thread entry point (such
+    as ``aider_mcp_server.main``) before the loop starts.
+
+    Skipped when a non-default policy (e.g. uvloop, which reaps children
+    itself) is active, when the kernel lacks pidfd support (< 5.3), and on
+    Python 3.12+ where asyncio already uses pidfds when available.
+    """
+    if sys.platform != "linux" or sys.version_info >= (3, 12):
+        return
+    if not hasattr(asyncio, "PidfdChildWatcher"):
+        return
+    policy = asyncio.get_event_loop_policy()
+    if type(policy) is not asyncio.DefaultEventLoopPolicy:
+        return
+    try:
+        os.close(os.pidfd_open(os.getpid()))
+    except (AttributeError, OSError):
+        return
+    policy.set_child_watcher(asyncio.PidfdChildWatcher())
 
 
 # ---------------------------------------------------------------------------
@@ -104,7 +198,8 @@ def init() -> dict[str, Any]:
 
     Performs lazy discovery of the ``aider`` CLI executable and caches the
     result for subsequent calls.  Safe to call multiple times -- subsequent
-    calls are no-ops that return the cached state.
+    calls are no-ops that return the same cached dict, which callers must
+    treat as read-only.
 
     Returns:
         dict with keys:
@@ -113,19 +208,38 @@ def init() -> dict[str, Any]:
             version (str):    Aider version string, or None.
             error (str):      Error message if initialization failed.
     """
-    global _initialized, _aider_executable, _aider_version
+    global _initialized, _aider_executable, _aider_version, _aider_cmd_prefix
+    global _init_result
+
+    # Fast path without the lock; the flag is only set once the result
+    # for the current discovery state is in place.
+    if _initialized:
+        return _init_result
 
     with _init_lock:
         if _initialized:
-            return {
-                "success": _aider_executable is not None,
-                "executable": _aider_executable,
-                "version": _aider_version,
-                "error": None if _aider_executable else "Aider executable not found",
-            }
-
-        # 1. Try to find aider on PATH
+            return _init_result
+
+        # 0. Reuse the result of a previous process's discovery
+        cache_key = _discovery_cache_key()
+        cached = _load_discovery_cache(cache_key)
+        if cached is not None:
+            _aider_executable, _aider_version = cached
+            _aider_cmd_prefix = _command_prefix(_aider_executable)
+            _init_result = _init_state()
+            _initialized = True
+            logger.info(
+                f"Aider bridge initialized: {_aider_executable} (v{_aider_version}, cached)"
+            )
+            return _init_result
+
+        # 1. Try to find aider on PATH.  Spawn with an absolute path so each
+        # subprocess start doesn't repeat the PATH (and PATHEXT) search, even
+        # when PATH holds relative entries.  abspath rather than resolve():
+        # venv console scripts must not be followed through symlinks.
         exe = shutil.which("aider")
+        if exe is not None:
+            exe = os.path.abspath(exe)
 
         # 2. Fallback: check the local installation's scripts directory
         if exe is None:
@@ -146,22 +260,29 @@ def init() -> dict[str, Any]:
             try:
                 result = subprocess.run(
                     [sys.executable, "-c", "import aider; print(aider.__version__)"],
+                    stdin=subprocess.DEVNULL,
                     capture_output=True, text=True, timeout=15,
                     cwd=str(AIDER_ROOT),
                     env={**os.environ, "PYTHONPATH": str(AIDER_ROOT)},
                 )
                 if result.returncode == 0 and result.stdout.strip():
                     # Use python -m invocation
-                    exe = f"{sys.executable} -m aider"
+                    exe = _MODULE_INVOCATION
                     _aider_version = result.stdout.strip()
             except (subprocess.TimeoutExpired, OSError):
                 pass
 
-        # 4. Retrieve version if we found a direct executable
+        # 4. Retrieve version if we found a direct executable.  A console
+        # script installed next to our interpreter belongs to this
+        # environment, so its package metadata answers without a subprocess.
+        if exe and _aider_version is None and Path(exe).parent == Path(sys.executable).parent:
+            _aider_version = _installed_aider_version()
+
         if exe and _aider_version is None:
             try:
                 result = subprocess.run(
-                    _split_cmd(exe) + ["--version"],
+                    list(_command_prefix(exe)) + ["--version"],
+                    stdin=subprocess.DEVNULL,
                     capture_output=True, text=True, timeout=15,
                 )
                 if result.returncode == 0:
@@ -170,22 +291,107 @@ def init() -> dict[str, Any]:
                 pass
 
         _aider_executable = exe if exe else None
+        _aider_cmd_prefix = _command_prefix(_aider_executable)
+        _init_result = _init_state()
         _initialized = True
 
         if _aider_executable:
             logger.info(f"Aider bridge initialized: {_aider_executable} (v{_aider_version})")
+            _save_discovery_cache(cache_key, _aider_executable, _aider_version)
         else:
             logger.warning(
                 "Aider bridge: executable not found. "
                 f"Install with: pip install -e {AIDER_ROOT}"
             )
 
-        return {
-            "success": _aider_executable is not None,
-            "executable": _aider_executable,
-            "version": _aider_version,
-            "error": None if _aider_executable else "Aider executable not found",
-        }
+        return _init_result
+
+
+def _init_state() -> dict[str, Any]:
+    """Build the ``init()`` result from the module-level discovery state."""
+    return {
+        "success": _aider_executable is not None,
+        "executable": _aider_executable,
+        "version": _aider_version,
+        "error": None if _aider_executable else "Aider executable not found",
+    }
+
+
+def _installed_aider_version() -> Optional[str]:
+    """Return the version of the Aider distribution installed in this environment."""
+    for dist in ("aider-chat", "aider"):
+        try:
+            return importlib.metadata.version(dist)
+        except importlib.metadata.PackageNotFoundError:
+            continue
+    return None
+
+
+def _discovery_cache_key() -> str:
+    """Fingerprint the inputs that decide where (and whether) Aider is found."""
+    try:
+        root_mtime = AIDER_ROOT.stat().st_mtime_ns
+    except OSError:
+        root_mtime = 0
+    raw = "\0".join(
+        (os.environ.get("PATH", ""), str(AIDER_ROOT), str(root_mtime), sys.executable)
+    )
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _executable_mtime(exe: str) -> Optional[int]:
+    """
+    Return ``st_mtime_ns`` of what *exe* runs, or None if it is missing.
+
+    For ``python -m aider`` this is the local ``aider`` package directory;
+    otherwise the executable itself, which reinstalling Aider rewrites.
+    """
+    path = AIDER_ROOT / "aider" if exe == _MODULE_INVOCATION else Path(exe)
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _load_discovery_cache(key: str) -> Optional[tuple[str, Optional[str]]]:
+    """
+    Return ``(executable, version)`` from the on-disk cache if still valid.
+
+    The entry is only trusted when its key matches and the executable
+    (see ``_executable_mtime``) still exists with the recorded mtime, so
+    an upgrade in place is picked up.
+    """
+    try:
+        with open(DISCOVERY_CACHE_PATH, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cache, dict) or cache.get("key") != key:
+        return None
+
+    exe = cache.get("executable")
+    if not isinstance(exe, str) or not exe:
+        return None
+    mtime = _executable_mtime(exe)
+    if mtime is None or cache.get("mtime_ns") != mtime:
+        return None
+    return exe, cache.get("version")
+
+
+def _save_discovery_cache(key: str, exe: str, version: Optional[str]) -> None:
+    """Persist a successful discovery; failures to write are ignored."""
+    entry = {
+        "key": key,
+        "executable": exe,
+        "mtime_ns": _executable_mtime(exe),
+        "version": version,
+    }
+    try:
+        DISCOVERY_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(DISCOVERY_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+    except OSError as e:
+        logger.debug(f"Could not write Aider discovery cache: {e}")
 
 
 # ---------------------------------------------------------------------------
@@ -275,7 +481,7 @@ async def edit_file(
             "output": "",
             "error": (
                 f"Unknown edit strategy '{edit_strategy}'. "
-                f"Valid strategies: {', '.join(sorted(EDIT_STRATEGIES.keys()))}"
+                f"Valid strategies: {_EDIT_STRATEGY_NAMES}"
             ),
             "file": file_path,
             "strategy": edit_strategy,
@@ -293,7 +499,7 @@ async def edit_file(
         }
 
     # Build command
-    cmd = _split_cmd(_aider_executable)
+    cmd = list(_aider_cmd_prefix)
     cmd += [
         "--message", instruction,
         "--edit-format", edit_strategy,
@@ -359,7 +565,7 @@ async def map_repo(
         }
 
     # Use --show-repo-map to dump the map and exit
-    cmd = _split_cmd(_aider_executable)
+    cmd = list(_aider_cmd_prefix)
     cmd += [
         "--show-repo-map",
         "--map-tokens", str(map_tokens),
@@ -381,6 +587,7 @@ async def auto_commit_changes(
     repo_path: str,
     message: Optional[str] = None,
     model: Optional[str] = None,
+    include_output: bool = True,
 ) -> dict[str, Any]:
     """
     Create a git commit using Aider's smart commit message generation.
@@ -398,6 +605,9 @@ async def auto_commit_changes(
         message:    Optional explicit commit message.  If None, Aider
                     generates one from the diff.
         model:      LLM model identifier for commit message generation.
+        include_output: Capture Aider's stdout.  Pass False when only
+                    ``success``/``error`` matter; stdout is then discarded
+                    and ``output`` is empty.
 
     Returns:
         dict with keys:
@@ -420,7 +630,7 @@ async def auto_commit_changes(
         }
 
     # Aider's --commit flag triggers a commit of pending changes and exits
-    cmd = _split_cmd(_aider_executable)
+    cmd = list(_aider_cmd_prefix)
     cmd += [
         "--commit",
         "--yes-always",
@@ -434,7 +644,7 @@ async def auto_commit_changes(
 
     return await _run_aider(cmd, cwd=str(repo), timeout=COMMIT_TIMEOUT, context={
         "repo": repo_path,
-    })
+    }, capture_stdout=include_output)
 
 
 async def lint_and_fix(
@@ -478,7 +688,7 @@ async def lint_and_fix(
             "file": file_path,
         }
 
-    cmd = _split_cmd(_aider_executable)
+    cmd = list(_aider_cmd_prefix)
     cmd += [
         "--message", "Lint this file and fix any issues found.",
         "--auto-lint",
@@ -529,6 +739,39 @@ def list_strategies() -> dict[str, Any]:
 # Unified execute dispatch (called by ToolRegistry)
 # ---------------------------------------------------------------------------
 
+def _status_dict() -> dict[str, Any]:
+    """Flatten ``status()`` into the dict shape returned by ``execute()``."""
+    s = status()
+    return {
+        "success": s.healthy,
+        "name": s.name,
+        "available": s.available,
+        "healthy": s.healthy,
+        "version": s.version,
+        "error": s.error,
+    }
+
+
+# Operation name -> handler, built once rather than per execute() call
+_ASYNC_OPERATIONS = {
+    "edit_file":    edit_file,
+    "map_repo":     map_repo,
+    "auto_commit":  auto_commit_changes,
+    "lint_and_fix": lint_and_fix,
+}
+_SYNC_OPERATIONS = {
+    "list_strategies": list_strategies,
+    "status":          _status_dict,
+    "init":            init,
+}
+_OPERATION_NAMES = ", ".join(sorted({**_ASYNC_OPERATIONS, **_SYNC_OPERATIONS}))
+# Operations holding the exclusive repo-write lock in the ResourceCoordinator
+_REPO_WRITE_OPERATIONS = frozenset(
+    op for op, reqs in TOOL_RESOURCES["aider"].items()
+    if any(req.resource is ResourceId.REPO_WRITE for req in reqs)
+)
+
+
 async def execute(operation: str, params: dict[str, Any]) -> dict[str, Any]:
     """
     Unified dispatch for the ToolRegistry.
@@ -553,74 +796,149 @@ async def execute(operation: str, params: dict[str, Any]) -> dict[str, Any]:
     Returns:
         dict with at least ``success`` and ``error`` keys.
     """
-    dispatch = {
-        "edit_file":       edit_file,
-        "map_repo":        map_repo,
-        "auto_commit":     auto_commit_changes,
-        "lint_and_fix":    lint_and_fix,
-        "list_strategies": None,  # sync, handled separately
-        "status":          None,  # sync, handled separately
-        "init":            None,  # sync, handled separately
-    }
+    # Synchronous operations
+    sync_func = _SYNC_OPERATIONS.get(operation)
+    if sync_func is not None:
+        return sync_func()
 
-    if operation not in dispatch:
+    func = _ASYNC_OPERATIONS.get(operation)
+    if func is None:
         return {
             "success": False,
             "error": (
                 f"Unknown operation '{operation}'. "
-                f"Available: {', '.join(sorted(dispatch.keys()))}"
+                f"Available: {_OPERATION_NAMES}"
             ),
         }
 
-    # Synchronous operations
-    if operation == "list_strategies":
-        return list_strategies()
-    if operation == "status":
-        s = status()
-        return {
-            "success": s.healthy,
-            "name": s.name,
-            "available": s.available,
-            "healthy": s.healthy,
-            "version": s.version,
-            "error": s.error,
-        }
-    if operation == "init":
-        return init()
-
-    # Async operations with ResourceCoordinator
-    async def _do_operation():
-        func = dispatch[operation]
-        return await func(**params)
-
+    # Async operations with ResourceCoordinator.  Only acquisition falls
+    # back to running uncoordinated; the operation itself runs exactly once.
     coordinator = get_coordinator()
     try:
-        async with coordinator.acquire("aider", "edit"):
-            return await _do_operation()
+        token = await coordinator.acquire_resources("aider", operation)
+    except ResourceCoordinatorError as e:
+        # Lock timeout or LLM budget exhausted: running anyway would defeat
+        # the coordination (e.g. two writers on one working tree)
+        return {
+            "success": False,
+            "error": f"Could not acquire resources for '{operation}': {e}",
+        }
     except Exception as coord_err:
         logger.warning(
             "ResourceCoordinator unavailable, running without coordination: %s",
             coord_err,
         )
-        try:
-            return await _do_operation()
-        except TypeError as e:
-            return {
-                "success": False,
-                "error": f"Invalid parameters for '{operation}': {e}",
-            }
+        return await _call_operation(func, operation, params)
+
+    try:
+        return await _call_operation(func, operation, params)
+    finally:
+        await coordinator.release_resources(token)
+
+
+async def _call_operation(
+    func: Any, operation: str, params: dict[str, Any]
+) -> dict[str, Any]:
+    """Await *func* with *params*, reporting a bad parameter set as an error."""
+    try:
+        return await func(**params)
+    except TypeError as e:
+        return {
+            "success": False,
+            "error": f"Invalid parameters for '{operation}': {e}",
+        }
+
+
+async def execute_batch(
+    operation: str,
+    params_list: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """
+    Run one operation for each parameter dict.
+
+    Each item goes through ``execute()``, so validation and resource
+    coordination are unchanged.  Read-only operations run concurrently
+    (at most ``MAX_PARALLEL`` Aider processes at once); operations that
+    write to the repository run one after another, since they would
+    otherwise queue on the exclusive repo lock and time out.
+
+    Args:
+        operation:   Name of the operation to execute (see ``execute()``).
+        params_list: One keyword-argument dict per invocation.
+
+    Returns:
+        List of result dicts, in the same order as ``params_list``.
+    """
+    if operation in _REPO_WRITE_OPERATIONS:
+        return [await execute(operation, params) for params in params_list]
+    return list(await asyncio.gather(
+        *(execute(operation, params) for params in params_list)
+    ))
 
 
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
+def _subprocess_env() -> dict[str, str]:
+    """
+    Return ``os.environ`` merged with ``_AIDER_ENV_OVERRIDES``.
+
+    The merged dict is reused until ``os.environ`` changes.  Comparing the
+    raw mapping against the snapshot it was built from costs about a
+    microsecond, whereas rebuilding decodes every variable (~100 us for a
+    typical environment).
+    """
+    global _aider_env, _aider_env_source
+
+    raw = getattr(os.environ, "_data", None)
+    if raw is None:  # not CPython's os._Environ; always rebuild
+        return {**os.environ, **_AIDER_ENV_OVERRIDES}
+    if _aider_env is None or raw != _aider_env_source:
+        _aider_env_source = dict(raw)
+        _aider_env = {**os.environ, **_AIDER_ENV_OVERRIDES}
+    return _aider_env
+
+
+def _spawn_semaphore() -> asyncio.Semaphore:
+    """Return the Aider spawn semaphore for the running event loop."""
+    global _spawn_sem, _spawn_sem_loop
+
+    loop = asyncio.get_running_loop()
+    if _spawn_sem is None or _spawn_sem_loop is not loop:
+        _spawn_sem = asyncio.Semaphore(MAX_PARALLEL)
+        _spawn_sem_loop = loop
+    return _spawn_sem
+
+
+def _command_prefix(exe: Optional[str]) -> tuple[str, ...]:
+    """
+    Return the argv prefix for a resolved Aider executable.
+
+    ``exe`` is either a path found during discovery or the
+    ``"<sys.executable> -m aider"`` form; both are mapped without
+    re-tokenizing so install paths containing spaces stay intact.
+
+    Args:
+        exe: The resolved executable string, or None.
+
+    Returns:
+        Tuple of command components (empty when ``exe`` is None).
+    """
+    if not exe:
+        return ()
+    if exe == _MODULE_INVOCATION:
+        return (sys.executable, "-m", "aider")
+    return (exe,)
+
+
 def _split_cmd(cmd_str: str) -> list[str]:
     """
     Split a command string into a list suitable for subprocess.
 
     Handles the case where ``_aider_executable`` might be a multi-word
-    string like ``"python -m aider"``.
+    string like ``"python -m aider"``.  The bridge's own operations use
+    the prefix cached by ``init()``; this is kept for other callers.
 
     Args:
         cmd_str: The command string to split.
@@ -630,7 +948,9 @@ def _split_cmd(cmd_str: str) -> list[str]:
     """
     if cmd_str is None:
         return []
-    return cmd_str.split()
+    if cmd_str == _aider_executable:
+        return list(_aider_cmd_prefix)
+    return shlex.split(cmd_str, posix=(os.name != "nt"))
 
 
 def _error_not_installed() -> dict[str, Any]:
@@ -639,16 +959,103 @@ def _error_not_installed() -> dict[str, Any]:
 
     Returns:
         dict with success=False and an informative error message including
-        the install command.
+        the install command (a copy of ``_ERROR_NOT_INSTALLED``, since
+        callers may extend it).
     """
-    return {
-        "success": False,
-        "output": "",
-        "error": (
-            "Aider is not installed or not found on PATH. "
-            f"Install with: pip install -e {AIDER_ROOT}"
-        ),
-    }
+    return dict(_ERROR_NOT_INSTALLED)
+
+
+async def _stop_process(process: asyncio.subprocess.Process) -> None:
+    """
+    Stop a timed-out Aider process together with its children.
+
+    On POSIX the process leads its own session, so the whole group gets
+    SIGTERM, up to ``TERMINATE_GRACE`` seconds to exit, then SIGKILL for
+    anything still running.  On Windows the process is killed directly.
+
+    Args:
+        process: The Aider subprocess started by ``_run_aider``.
+    """
+    if sys.platform == "win32":
+        process.kill()
+        await process.wait()
+        return
+
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+    except ProcessLookupError:
+        pass
+    try:
+        await asyncio.wait_for(process.wait(), timeout=TERMINATE_GRACE)
+    except asyncio.TimeoutError:
+        pass
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+    await process.wait()
+
+
+async def _read_stream(
+    stream: Optional[asyncio.StreamReader],
+    limit: int,
+    stop_at_limit: bool,
+) -> tuple[bytes, bool]:
+    """
+    Read a subprocess pipe to EOF, keeping at most ``limit`` bytes.
+
+    Args:
+        stream:        The pipe, or None when it was not captured.
+        limit:         Maximum number of bytes to keep.
+        stop_at_limit: Return as soon as the limit is exceeded; otherwise
+                       keep draining (and discarding) so the writer never
+                       blocks on a full pipe.
+
+    Returns:
+        Tuple of (kept bytes, whether the limit was exceeded).
+    """
+    if stream is None:
+        return b"", False
+
+    buf = bytearray()
+    exceeded = False
+    while chunk := await stream.read(65536):
+        if not exceeded:
+            buf += chunk
+            if len(buf) > limit:
+                exceeded = True
+                del buf[limit:]
+                if stop_at_limit:
+                    break
+    return bytes(buf), exceeded
+
+
+async def _communicate_bounded(
+    process: asyncio.subprocess.Process,
+) -> tuple[bytes, bytes, bool]:
+    """
+    Like ``process.communicate()``, but with stdout capped at ``MAX_OUTPUT_BYTES``.
+
+    If stdout goes over the cap the process group is stopped rather than
+    buffering the rest.  stderr is drained concurrently with the same cap.
+
+    Returns:
+        Tuple of (stdout bytes, stderr bytes, whether stdout was truncated).
+    """
+    stderr_task = asyncio.create_task(
+        _read_stream(process.stderr, MAX_OUTPUT_BYTES, stop_at_limit=False)
+    )
+    try:
+        stdout_bytes, truncated = await _read_stream(
+            process.stdout, MAX_OUTPUT_BYTES, stop_at_limit=True
+        )
+        if truncated:
+            await _stop_process(process)
+        stderr_bytes, _ = await stderr_task
+    finally:
+        stderr_task.cancel()
+    await process.wait()
+    return stdout_bytes, stderr_bytes, truncated
 
 
 async def _run_aider(
@@ -656,6 +1063,7 @@ async def _run_aider(
     cwd: str,
     timeout: int,
     context: Optional[dict[str, Any]] = None,
+    capture_stdout: bool = True,
 ) -> dict[str, Any]:
     """
     Execute an Aider subprocess asynchronously and capture its output.
@@ -672,6 +1080,8 @@ async def _run_aider(
         cwd:      Working directory for the subprocess.
         timeout:  Maximum execution time in seconds.
         context:  Additional key-value pairs merged into the return dict.
+        capture_stdout: If False, stdout goes to DEVNULL and ``output`` is
+                  empty; stderr is still captured for errors.
 
     Returns:
         dict with keys:
@@ -680,11 +1090,7 @@ async def _run_aider(
             error (str):     Stderr content or timeout message, else None.
             Plus any keys from ``context``.
     """
-    env = {**os.environ}
-    env["AIDER_YES"] = "true"
-    env["PYTHONUNBUFFERED"] = "1"
-    # Prevent Aider from launching a browser or interactive prompts
-    env["AIDER_NO_GUI"] = "true"
+    env = _subprocess_env()
 
     result = {
         "success": False,
@@ -697,44 +1103,64 @@ async def _run_aider(
     logger.debug(f"Aider bridge exec: {' '.join(cmd)} (cwd={cwd}, timeout={timeout}s)")
 
     try:
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            cwd=cwd,
-            env=env,
-        )
-
-        try:
-            stdout_bytes, stderr_bytes = await asyncio.wait_for(
-                process.communicate(),
-                timeout=timeout,
+        # Bound how many Aider processes run at once (see execute_batch)
+        async with _spawn_semaphore():
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                # Never inherit fd 0: the MCP server's stdin carries JSON-RPC
+                # and is switched to non-blocking mode by its reader
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=(
+                    asyncio.subprocess.PIPE if capture_stdout
+                    else asyncio.subprocess.DEVNULL
+                ),
+                stderr=asyncio.subprocess.PIPE,
+                cwd=cwd,
+                env=env,
+                **_SPAWN_KWARGS,
             )
-        except asyncio.TimeoutError:
-            process.kill()
-            await process.wait()
-            result["error"] = (
-                f"Aider process timed out after {timeout}s. "
-                "Consider increasing the timeout or simplifying the instruction."
-            )
-            logger.warning(f"Aider timed out: {' '.join(cmd[:5])}...")
-            return result
 
-        stdout = stdout_bytes.decode("utf-8", errors="replace").strip()
-        stderr = stderr_bytes.decode("utf-8", errors="replace").strip()
+            try:
+                stdout_bytes, stderr_bytes, truncated = await asyncio.wait_for(
+                    _communicate_bounded(process),
+                    timeout=timeout,
+                )
+            except asyncio.TimeoutError:
+                await _stop_process(process)
+                result["error"] = (
+                    f"Aider process timed out after {timeout}s. "
+                    "Consider increasing the timeout or simplifying the instruction."
+                )
+                logger.warning(f"Aider timed out: {' '.join(cmd[:5])}...")
+                return result
+
+        stdout = (
+            stdout_bytes.decode("utf-8", errors="replace").strip()
+            if stdout_bytes else ""
+        )
 
         result["output"] = stdout
         result["success"] = process.returncode == 0
 
-        if process.returncode != 0:
+        if truncated:
+            result["success"] = False
+            result["error"] = (
+                f"Aider output exceeded {MAX_OUTPUT_BYTES} bytes; the process "
+                "was stopped and the output is truncated."
+            )
+            logger.warning(f"Aider output limit hit: {' '.join(cmd[:5])}...")
+        elif process.returncode != 0:
+            stderr = stderr_bytes.decode("utf-8", errors="replace").strip()
             result["error"] = stderr or f"Aider exited with code {process.returncode}"
             logger.warning(
                 f"Aider exited {process.returncode}: "
                 f"{stderr[:200] if stderr else '(no stderr)'}"
             )
-        elif stderr:
-            # Non-fatal stderr (warnings, progress messages)
-            logger.debug(f"Aider stderr (non-fatal): {stderr[:200]}")
+        elif stderr_bytes and not stderr_bytes.isspace():
+            # Non-fatal stderr (warnings, progress messages) is only logged,
+            # so decode just the prefix that ends up in the log line.
+            stderr_head = stderr_bytes[:200].decode("utf-8", errors="replace").strip()
+            logger.debug(f"Aider stderr (non-fatal): {stderr_head}")
 
     except FileNotFoundError:
         result["error"] = (
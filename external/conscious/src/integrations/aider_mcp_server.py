@@ -21,10 +21,15 @@ Extension config (goose profiles):
 """
 
 import asyncio
+import hashlib
+import importlib.util
 import json
 import logging
 import os
 import sys
+import threading
+import time
+from collections import OrderedDict
 from typing import Any, Optional
 
 # ---------------------------------------------------------------------------
@@ -61,31 +66,189 @@ SERVER_VERSION = "1.0.0"
 PROTOCOL_VERSION = "2024-11-05"
 
 # ---------------------------------------------------------------------------
-# Try to use the ``mcp`` Python package (FastMCP) if available
+# Use the ``mcp`` Python package (FastMCP) if available.  Only its presence
+# is checked at import; the package itself (pydantic, anyio, httpx, ...) is
+# loaded by _load_fastmcp() when the server starts in that mode.
+# ---------------------------------------------------------------------------
+_USE_FASTMCP = importlib.util.find_spec("mcp") is not None
+
+# ---------------------------------------------------------------------------
+# Optional: precompiled inputSchema validation for the raw JSON-RPC path
+# (an equivalent built-in check is used without it)
 # ---------------------------------------------------------------------------
-_USE_FASTMCP = False
 try:
-    from mcp.server.fastmcp import FastMCP
-    from mcp.shared.exceptions import McpError
-    from mcp.types import ErrorData, INTERNAL_ERROR, INVALID_PARAMS
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None  # type: ignore[assignment]
 
-    _USE_FASTMCP = True
-    logger.info("Using FastMCP from the 'mcp' package")
+# ---------------------------------------------------------------------------
+# Optional: orjson for the stdio JSON-RPC framing and tool result text
+# (stdlib json fallback).  Tool result text is compact; it is only
+# pretty-printed when debug logging is on.
+# ---------------------------------------------------------------------------
+try:
+    import orjson
 except ImportError:
-    logger.info("'mcp' package not found -- falling back to raw JSON-RPC")
+    orjson = None  # type: ignore[assignment]
+
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _encode_line(msg: dict) -> bytes:
+        return orjson.dumps(msg, default=str, option=orjson.OPT_APPEND_NEWLINE)
+
+    def _dumps_text(obj: Any) -> str:
+        option = orjson.OPT_INDENT_2 if logger.isEnabledFor(logging.DEBUG) else 0
+        return orjson.dumps(obj, option=option).decode("utf-8")
+else:
+    _json_loads = json.loads
+
+    def _encode_line(msg: dict) -> bytes:
+        return (json.dumps(msg, default=str) + "\n").encode("utf-8")
+
+    def _dumps_text(obj: Any) -> str:
+        indent = 2 if logger.isEnabledFor(logging.DEBUG) else None
+        return json.dumps(obj, indent=indent)
+
+
+# ---------------------------------------------------------------------------
+# Repository map cache (shared by both server paths)
+# ---------------------------------------------------------------------------
+# Successful aider_map_repo results, keyed on (directory, map_tokens, model,
+# worktree token).  The token digests ``git status`` (which includes HEAD)
+# plus the mtime/size of every changed path, so unstaged edits made by other
+# tools invalidate an entry.  Entries expire after the TTL, the whole cache
+# is dropped whenever an edit/commit/lint tool runs through this server, and
+# directories that are not git worktrees are never cached.
+MAP_REPO_CACHE_TTL = 300.0   # seconds
+MAP_REPO_CACHE_SIZE = 32
+
+_map_repo_cache: "OrderedDict[tuple, tuple[float, dict[str, Any]]]" = OrderedDict()
+
+
+async def _worktree_token(directory: str) -> Optional[str]:
+    """
+    Digest the git worktree state of *directory*, or None if unavailable.
+
+    Runs ``git status --porcelain=v2 --branch -z`` (HEAD, staged, unstaged
+    and untracked entries) and mixes in ``st_mtime_ns``/``st_size`` of each
+    listed path, so a second edit to an already-dirty file also changes it.
+    """
+    try:
+        process = await asyncio.create_subprocess_exec(
+            "git", "--no-optional-locks", "-C", directory,
+            "status", "--porcelain=v2", "--branch", "-z",
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        status, _ = await process.communicate()
+    except OSError:
+        return None
+    if process.returncode != 0:
+        return None
+
+    digest = hashlib.blake2b(status, digest_size=16)
+    records = iter(status.split(b"\0"))
+    for record in records:
+        kind = record[:1]
+        if kind == b"1":
+            path = record.split(b" ", 8)[-1]
+        elif kind == b"2":
+            path = record.split(b" ", 9)[-1]
+            next(records, None)  # original path of the rename
+        elif kind == b"u":
+            path = record.split(b" ", 10)[-1]
+        elif kind == b"?":
+            path = record[2:]
+        else:
+            continue
+        try:
+            st = os.stat(os.path.join(os.fsencode(directory), path))
+        except OSError:
+            continue  # deleted; already reflected in the status text
+        digest.update(b"%d:%d\0" % (st.st_mtime_ns, st.st_size))
+    return digest.hexdigest()
+
+
+async def _map_repo_cache_key(
+    directory: str,
+    map_tokens: int,
+    model: Optional[str],
+) -> Optional[tuple]:
+    """Build the cache key, or None when the worktree state is unknown."""
+    directory = os.path.abspath(directory)
+    token = await _worktree_token(directory)
+    if token is None:
+        return None
+    return (directory, map_tokens, model, token)
+
+
+async def _map_repo_cached(
+    directory: str,
+    map_tokens: int,
+    model: Optional[str],
+) -> dict[str, Any]:
+    """Return ``aider_bridge.map_repo``'s result, reusing a fresh cached one."""
+    key = await _map_repo_cache_key(directory, map_tokens, model)
+    if key is None:
+        return await aider_bridge.map_repo(
+            repo_path=directory,
+            map_tokens=map_tokens,
+            model=model,
+        )
+
+    entry = _map_repo_cache.get(key)
+    if entry is not None:
+        cached_at, result = entry
+        if time.monotonic() - cached_at < MAP_REPO_CACHE_TTL:
+            _map_repo_cache.move_to_end(key)
+            return result
+        del _map_repo_cache[key]
+
+    result = await aider_bridge.map_repo(
+        repo_path=directory,
+        map_tokens=map_tokens,
+        model=model,
+    )
+    if result.get("success"):
+        _map_repo_cache[key] = (time.monotonic(), result)
+        if len(_map_repo_cache) > MAP_REPO_CACHE_SIZE:
+            _map_repo_cache.popitem(last=False)
+    return result
 
 
 # =========================================================================
 # PATH 1: FastMCP-based server
 # =========================================================================
 
-if _USE_FASTMCP:
+def _load_fastmcp() -> Optional[Any]:
+    """
+    Import FastMCP and build the server with the Aider tools registered.
+
+    Returns:
+        The FastMCP server, or None if the ``mcp`` package cannot provide it
+        (the caller then falls back to raw JSON-RPC).
+    """
+    try:
+        from mcp.server.fastmcp import FastMCP
+        from mcp.shared.exceptions import McpError
+        from mcp.types import ErrorData, INTERNAL_ERROR
+    except ImportError:
+        logger.info("'mcp' package not usable -- falling back to raw JSON-RPC")
+        return None
+    logger.info("Using FastMCP from the 'mcp' package")
 
     mcp_server = FastMCP(
         SERVER_NAME,
         version=SERVER_VERSION,
     )
 
+    def _tool_error(name: str, exc: Exception) -> McpError:
+        """Log a failed tool call and build the MCP error to raise for it."""
+        logger.error("%s failed: %s", name, exc, exc_info=True)
+        return McpError(ErrorData(INTERNAL_ERROR, f"{name} error: {exc}"))
+
     @mcp_server.tool()
     async def aider_edit(
         file_path: str,
@@ -118,10 +281,10 @@ if _USE_FASTMCP:
                 model=model,
                 auto_commit=auto_commit,
             )
-            return json.dumps(result, indent=2)
+            _map_repo_cache.clear()  # the repository may have changed
+            return _dumps_text(result)
         except Exception as e:
-            logger.error(f"aider_edit failed: {e}", exc_info=True)
-            raise McpError(ErrorData(INTERNAL_ERROR, f"aider_edit error: {e}")) from e
+            raise _tool_error("aider_edit", e) from e
 
     @mcp_server.tool()
     async def aider_map_repo(
@@ -143,15 +306,10 @@ if _USE_FASTMCP:
             JSON string with {success, output, error, repo}.
         """
         try:
-            result = await aider_bridge.map_repo(
-                repo_path=directory,
-                map_tokens=map_tokens,
-                model=model,
-            )
-            return json.dumps(result, indent=2)
+            result = await _map_repo_cached(directory, map_tokens, model)
+            return _dumps_text(result)
         except Exception as e:
-            logger.error(f"aider_map_repo failed: {e}", exc_info=True)
-            raise McpError(ErrorData(INTERNAL_ERROR, f"aider_map_repo error: {e}")) from e
+            raise _tool_error("aider_map_repo", e) from e
 
     @mcp_server.tool()
     async def aider_commit(
@@ -178,10 +336,10 @@ if _USE_FASTMCP:
                 message=message,
                 model=model,
             )
-            return json.dumps(result, indent=2)
+            _map_repo_cache.clear()  # the repository may have changed
+            return _dumps_text(result)
         except Exception as e:
-            logger.error(f"aider_commit failed: {e}", exc_info=True)
-            raise McpError(ErrorData(INTERNAL_ERROR, f"aider_commit error: {e}")) from e
+            raise _tool_error("aider_commit", e) from e
 
     @mcp_server.tool()
     async def aider_lint(
@@ -211,10 +369,10 @@ if _USE_FASTMCP:
                 model=model,
                 auto_commit=auto_commit,
             )
-            return json.dumps(result, indent=2)
+            _map_repo_cache.clear()  # the repository may have changed
+            return _dumps_text(result)
         except Exception as e:
-            logger.error(f"aider_lint failed: {e}", exc_info=True)
-            raise McpError(ErrorData(INTERNAL_ERROR, f"aider_lint error: {e}")) from e
+            raise _tool_error("aider_lint", e) from e
 
     @mcp_server.tool()
     def aider_strategies() -> str:
@@ -226,13 +384,9 @@ if _USE_FASTMCP:
         Returns:
             JSON string with {success, strategies, default, count}.
         """
-        result = aider_bridge.list_strategies()
-        return json.dumps(result, indent=2)
+        return _STRATEGIES_TEXT
 
-    def run_fastmcp():
-        """Entry point for FastMCP mode."""
-        logger.info("Starting Aider MCP server (FastMCP mode)")
-        mcp_server.run()
+    return mcp_server
 
 
 # =========================================================================
@@ -260,16 +414,16 @@ TOOL_DEFINITIONS = [
                     "description": "Natural-language description of the desired change.",
                 },
                 "strategy": {
-                    "type": "string",
+                    "type": ["string", "null"],
                     "description": "Edit strategy name (default 'diff'). See aider_strategies.",
                     "default": "diff",
                 },
                 "model": {
-                    "type": "string",
+                    "type": ["string", "null"],
                     "description": "Optional LLM model identifier for Aider to use.",
                 },
                 "auto_commit": {
-                    "type": "boolean",
+                    "type": ["boolean", "null"],
                     "description": "Whether to auto-commit the changes (default false).",
                     "default": False,
                 },
@@ -292,12 +446,12 @@ TOOL_DEFINITIONS = [
                     "description": "Path to the repository root directory.",
                 },
                 "map_tokens": {
-                    "type": "integer",
+                    "type": ["integer", "null"],
                     "description": "Target token budget for the map (default 2048).",
                     "default": 2048,
                 },
                 "model": {
-                    "type": "string",
+                    "type": ["string", "null"],
                     "description": "Optional LLM model identifier (for tokenizer selection).",
                 },
             },
@@ -319,11 +473,11 @@ TOOL_DEFINITIONS = [
                     "description": "Path to the git repository.",
                 },
                 "message": {
-                    "type": "string",
+                    "type": ["string", "null"],
                     "description": "Optional explicit commit message.",
                 },
                 "model": {
-                    "type": "string",
+                    "type": ["string", "null"],
                     "description": "Optional LLM model identifier.",
                 },
             },
@@ -344,15 +498,15 @@ TOOL_DEFINITIONS = [
                     "description": "Path to the file to lint and fix.",
                 },
                 "lint_cmd": {
-                    "type": "string",
+                    "type": ["string", "null"],
                     "description": "Custom lint command (e.g. 'ruff check --fix').",
                 },
                 "model": {
-                    "type": "string",
+                    "type": ["string", "null"],
                     "description": "Optional LLM model identifier.",
                 },
                 "auto_commit": {
-                    "type": "boolean",
+                    "type": ["boolean", "null"],
                     "description": "Whether to auto-commit the fixes (default false).",
                     "default": False,
                 },
@@ -375,39 +529,139 @@ TOOL_DEFINITIONS = [
 ]
 
 
+_SCHEMA_TYPES: dict[str, tuple[type, ...]] = {
+    "string": (str,),
+    "integer": (int,),
+    "boolean": (bool,),
+    "object": (dict,),
+    "null": (type(None),),
+}
+
+
+def _check_arguments(schema: dict[str, Any], arguments: Any) -> Optional[str]:
+    """
+    Check *arguments* against a tool ``inputSchema`` without fastjsonschema.
+
+    Covers the subset the tool schemas use (object, ``required``, per-property
+    ``type`` including type lists).  Returns an error message or None.
+    """
+    if not isinstance(arguments, dict):
+        return "data must be object"
+    missing = [name for name in schema.get("required", ()) if name not in arguments]
+    if missing:
+        return f"data must contain {missing} properties"
+    for name, prop in schema.get("properties", {}).items():
+        if name not in arguments:
+            continue
+        value = arguments[name]
+        types = prop.get("type")
+        types = [types] if isinstance(types, str) else types or ()
+        if not any(
+            isinstance(value, _SCHEMA_TYPES[t])
+            and not (t == "integer" and isinstance(value, bool))
+            for t in types
+        ):
+            return f"data.{name} must be {' or '.join(types)}"
+    return None
+
+
+def _schema_validator(schema: dict[str, Any]) -> Any:
+    """Return ``validate(arguments) -> Optional[str]`` for a tool schema."""
+    if fastjsonschema is None:
+        return lambda arguments: _check_arguments(schema, arguments)
+
+    compiled = fastjsonschema.compile(schema)
+
+    def validate(arguments: Any) -> Optional[str]:
+        try:
+            compiled(arguments)
+        except fastjsonschema.JsonSchemaException as e:
+            return e.message
+        return None
+
+    return validate
+
+
+# Argument validators built once from each tool's inputSchema: precompiled
+# with ``fastjsonschema`` when installed, else the equivalent _check_arguments
+_ARG_VALIDATORS = {t["name"]: _schema_validator(t["inputSchema"]) for t in TOOL_DEFINITIONS}
+
+
+def _optional(arguments: dict[str, Any], name: str, default: Any) -> Any:
+    """Return ``arguments[name]``, or *default* when it is missing or null."""
+    value = arguments.get(name)
+    return default if value is None else value
+
+
+async def _call_edit(arguments: dict[str, Any]) -> dict[str, Any]:
+    result = await aider_bridge.edit_file(
+        file_path=arguments["file_path"],
+        instruction=arguments["instruction"],
+        edit_strategy=_optional(arguments, "strategy", "diff"),
+        model=arguments.get("model"),
+        auto_commit=_optional(arguments, "auto_commit", False),
+    )
+    _map_repo_cache.clear()  # the repository may have changed
+    return result
+
+
+async def _call_map_repo(arguments: dict[str, Any]) -> dict[str, Any]:
+    return await _map_repo_cached(
+        arguments["directory"],
+        _optional(arguments, "map_tokens", 2048),
+        arguments.get("model"),
+    )
+
+
+async def _call_commit(arguments: dict[str, Any]) -> dict[str, Any]:
+    result = await aider_bridge.auto_commit_changes(
+        repo_path=arguments["repo_path"],
+        message=arguments.get("message"),
+        model=arguments.get("model"),
+    )
+    _map_repo_cache.clear()  # the repository may have changed
+    return result
+
+
+async def _call_lint(arguments: dict[str, Any]) -> dict[str, Any]:
+    result = await aider_bridge.lint_and_fix(
+        file_path=arguments["file_path"],
+        lint_cmd=arguments.get("lint_cmd"),
+        model=arguments.get("model"),
+        auto_commit=_optional(arguments, "auto_commit", False),
+    )
+    _map_repo_cache.clear()  # the repository may have changed
+    return result
+
+
+async def _call_strategies(arguments: dict[str, Any]) -> dict[str, Any]:
+    return aider_bridge.list_strategies()
+
+
+# Tool name -> pre-rendered content text for tools whose result never
+# changes (the strategy table is a module constant in aider_bridge)
+_STRATEGIES_TEXT = _dumps_text(aider_bridge.list_strategies())
+_STATIC_TOOL_TEXT = {
+    "aider_strategies": _STRATEGIES_TEXT,
+}
+
+
+# Tool name -> handler.  Every handler takes the raw ``arguments`` dict.
+_TOOL_HANDLERS = {
+    "aider_edit":       _call_edit,
+    "aider_map_repo":   _call_map_repo,
+    "aider_commit":     _call_commit,
+    "aider_lint":       _call_lint,
+    "aider_strategies": _call_strategies,
+}
+
+
 async def _handle_tool_call(tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
     """Dispatch a tool call to the appropriate aider_bridge function."""
-    if tool_name == "aider_edit":
-        return await aider_bridge.edit_file(
-            file_path=arguments["file_path"],
-            instruction=arguments["instruction"],
-            edit_strategy=arguments.get("strategy", "diff"),
-            model=arguments.get("model"),
-            auto_commit=arguments.get("auto_commit", False),
-        )
-    elif tool_name == "aider_map_repo":
-        return await aider_bridge.map_repo(
-            repo_path=arguments["directory"],
-            map_tokens=arguments.get("map_tokens", 2048),
-            model=arguments.get("model"),
-        )
-    elif tool_name == "aider_commit":
-        return await aider_bridge.auto_commit_changes(
-            repo_path=arguments["repo_path"],
-            message=arguments.get("message"),
-            model=arguments.get("model"),
-        )
-    elif tool_name == "aider_lint":
-        return await aider_bridge.lint_and_fix(
-            file_path=arguments["file_path"],
-            lint_cmd=arguments.get("lint_cmd"),
-            model=arguments.get("model"),
-            auto_commit=arguments.get("auto_commit", False),
-        )
-    elif tool_name == "aider_strategies":
-        return aider_bridge.list_strategies()
-    else:
+    handler = _TOOL_HANDLERS.get(tool_name)
+    if handler is None:
         return {"success": False, "error": f"Unknown tool: {tool_name}"}
+    return await handler(arguments)
 
 
 def _make_response(req_id: Any, result: Any) -> dict:
@@ -431,6 +685,117 @@ INVALID_PARAMS_CODE = -32602
 INTERNAL_ERROR_CODE = -32603
 
 
+# Tool name -> definition, for O(1) validation of tools/call requests
+_TOOLS_BY_NAME = {t["name"]: t for t in TOOL_DEFINITIONS}
+_AVAILABLE_TOOLS = ", ".join(sorted(_TOOLS_BY_NAME))
+
+
+# Static results, built once and shared by every response (never mutated)
+_INITIALIZE_RESULT = {
+    "protocolVersion": PROTOCOL_VERSION,
+    "capabilities": {
+        "tools": {"listChanged": False},
+    },
+    "serverInfo": {
+        "name": SERVER_NAME,
+        "version": SERVER_VERSION,
+    },
+}
+_TOOLS_LIST_RESULT = {"tools": TOOL_DEFINITIONS}
+_EMPTY_RESULT: dict = {}
+
+# Stand-in for a missing/null ``params`` or ``arguments``; only ever read
+# (no tool with an empty ``required`` list declares schema defaults, so
+# validation never fills it in)
+_EMPTY_DICT: dict = {}
+
+
+async def _handle_initialize(req_id: Any, params: dict) -> Optional[dict]:
+    """Handle ``initialize``: advertise protocol version and capabilities."""
+    return _make_response(req_id, _INITIALIZE_RESULT)
+
+
+async def _handle_initialized(req_id: Any, params: dict) -> Optional[dict]:
+    """Handle the ``initialized`` notification (no response)."""
+    logger.info("Client completed initialization handshake")
+    return None  # notification, no response
+
+
+async def _handle_ping(req_id: Any, params: dict) -> Optional[dict]:
+    """Handle ``ping`` with an empty result."""
+    return _make_response(req_id, _EMPTY_RESULT)
+
+
+async def _handle_tools_list(req_id: Any, params: dict) -> Optional[dict]:
+    """Handle ``tools/list`` with the static tool definitions."""
+    return _make_response(req_id, _TOOLS_LIST_RESULT)
+
+
+async def _handle_tools_call(req_id: Any, params: dict) -> Optional[dict]:
+    """Handle ``tools/call``: validate the tool and arguments, then dispatch."""
+    tool_name = params.get("name", "")
+    arguments = params.get("arguments") or _EMPTY_DICT
+
+    # Validate tool exists
+    if tool_name not in _TOOLS_BY_NAME:
+        return _make_error(
+            req_id,
+            METHOD_NOT_FOUND,
+            f"Unknown tool: {tool_name}. Available: {_AVAILABLE_TOOLS}",
+        )
+
+    invalid = _ARG_VALIDATORS[tool_name](arguments)
+    if invalid is not None:
+        return _make_error(
+            req_id,
+            INVALID_PARAMS_CODE,
+            f"Invalid arguments for {tool_name}: {invalid}",
+        )
+
+    static_text = _STATIC_TOOL_TEXT.get(tool_name)
+    if static_text is not None:
+        return _make_response(req_id, {
+            "content": [{"type": "text", "text": static_text}],
+            "isError": False,
+        })
+
+    try:
+        result = await _handle_tool_call(tool_name, arguments)
+        # MCP tools/call returns content as an array of content blocks
+        content_text = _dumps_text(result)
+        is_error = not result.get("success", True)
+        return _make_response(req_id, {
+            "content": [{"type": "text", "text": content_text}],
+            "isError": is_error,
+        })
+    except KeyError as e:
+        return _make_error(
+            req_id,
+            INVALID_PARAMS_CODE,
+            f"Missing required parameter: {e}",
+        )
+    except Exception as e:
+        logger.error("Tool call %s failed: %s", tool_name, e, exc_info=True)
+        return _make_response(req_id, {
+            "content": [{"type": "text", "text": _dumps_text({
+                "success": False,
+                "error": str(e),
+            })}],
+            "isError": True,
+        })
+
+
+# JSON-RPC method -> handler(req_id, params)
+_METHOD_HANDLERS = {
+    "initialize":                _handle_initialize,
+    "notifications/initialized": _handle_initialized,
+    "initialized":               _handle_initialized,
+    "ping":                      _handle_ping,
+    "tools/list":                _handle_tools_list,
+    "tools/call":                _handle_tools_call,
+}
+
+
 async def _handle_message(msg: dict) -> Optional[dict]:
     """
     Process a single JSON-RPC message according to the MCP protocol.
@@ -439,81 +804,20 @@ async def _handle_message(msg: dict) -> Optional[dict]:
     """
     req_id = msg.get("id")
     method = msg.get("method", "")
-    params = msg.get("params", {})
-
-    logger.debug(f"Received: method={method} id={req_id}")
+    params = msg.get("params") or _EMPTY_DICT
 
-    # ---- initialize ----
-    if method == "initialize":
-        return _make_response(req_id, {
-            "protocolVersion": PROTOCOL_VERSION,
-            "capabilities": {
-                "tools": {"listChanged": False},
-            },
-            "serverInfo": {
-                "name": SERVER_NAME,
-                "version": SERVER_VERSION,
-            },
-        })
-
-    # ---- notifications/initialized ----
-    if method == "notifications/initialized" or method == "initialized":
-        logger.info("Client completed initialization handshake")
-        return None  # notification, no response
-
-    # ---- ping ----
-    if method == "ping":
-        return _make_response(req_id, {})
-
-    # ---- tools/list ----
-    if method == "tools/list":
-        return _make_response(req_id, {"tools": TOOL_DEFINITIONS})
-
-    # ---- tools/call ----
-    if method == "tools/call":
-        tool_name = params.get("name", "")
-        arguments = params.get("arguments", {})
-
-        # Validate tool exists
-        valid_tools = {t["name"] for t in TOOL_DEFINITIONS}
-        if tool_name not in valid_tools:
-            return _make_error(
-                req_id,
-                METHOD_NOT_FOUND,
-                f"Unknown tool: {tool_name}. Available: {', '.join(sorted(valid_tools))}",
-            )
+    logger.debug("Received: method=%s id=%s", method, req_id)
 
-        try:
-            result = await _handle_tool_call(tool_name, arguments)
-            # MCP tools/call returns content as an array of content blocks
-            content_text = json.dumps(result, indent=2)
-            is_error = not result.get("success", True)
-            return _make_response(req_id, {
-                "content": [{"type": "text", "text": content_text}],
-                "isError": is_error,
-            })
-        except KeyError as e:
-            return _make_error(
-                req_id,
-                INVALID_PARAMS_CODE,
-                f"Missing required parameter: {e}",
-            )
-        except Exception as e:
-            logger.error(f"Tool call {tool_name} failed: {e}", exc_info=True)
-            return _make_response(req_id, {
-                "content": [{"type": "text", "text": json.dumps({
-                    "success": False,
-                    "error": str(e),
-                })}],
-                "isError": True,
-            })
+    handler = _METHOD_HANDLERS.get(method)
+    if handler is not None:
+        return await handler(req_id, params)
 
     # ---- unknown method ----
     if req_id is not None:
         return _make_error(req_id, METHOD_NOT_FOUND, f"Unknown method: {method}")
 
     # Unknown notification -- ignore
-    logger.debug(f"Ignoring unknown notification: {method}")
+    logger.debug("Ignoring unknown notification: %s", method)
     return None
 
 
@@ -523,58 +827,132 @@ def _write_stdout(msg: dict) -> None:
     Uses the raw binary stdout buffer to avoid encoding issues on Windows
     and ensures the output is flushed immediately.
     """
-    data = json.dumps(msg) + "\n"
-    sys.stdout.buffer.write(data.encode("utf-8"))
+    _write_stdout_bytes(_encode_line(msg))
+
+
+def _write_stdout_bytes(line: bytes) -> None:
+    """Write an already-encoded, newline-terminated JSON-RPC line to stdout."""
+    sys.stdout.buffer.write(line)
     sys.stdout.buffer.flush()
 
 
+# ``ping`` response with an integer id, pre-encoded around the id
+_PING_PREFIX = b'{"jsonrpc":"2.0","id":'
+_PING_SUFFIX = b',"result":{}}\n'
+
+
+def _ping_fast_path(msg: Any) -> Optional[bytes]:
+    """Return the encoded response for a keepalive ``ping`` with an int id."""
+    if type(msg) is not dict or msg.get("method") != "ping":
+        return None
+    req_id = msg.get("id")
+    if type(req_id) is not int:  # excludes bool; other ids take the normal path
+        return None
+    return b"%s%d%s" % (_PING_PREFIX, req_id, _PING_SUFFIX)
+
+
+# Largest single JSON-RPC line accepted from stdin (edit instructions can be long)
+_STDIN_LINE_LIMIT = 16 * 1024 * 1024
+
+
+async def _open_stdin_reader(
+    loop: asyncio.AbstractEventLoop,
+) -> Optional[asyncio.StreamReader]:
+    """
+    Attach an asyncio StreamReader to stdin.
+
+    Returns None when stdin cannot be read through the event loop (always on
+    Windows, where connect_read_pipe is unreliable with console handles, or
+    when stdin is a regular file), in which case the caller falls back to
+    the thread-based reader.
+    """
+    if sys.platform == "win32":
+        return None
+
+    reader = asyncio.StreamReader(limit=_STDIN_LINE_LIMIT)
+    protocol = asyncio.StreamReaderProtocol(reader)
+    try:
+        await loop.connect_read_pipe(lambda: protocol, sys.stdin.buffer)
+    except (OSError, ValueError) as e:
+        logger.debug("stdin not usable as an asyncio pipe (%s); using thread reader", e)
+        return None
+    return reader
+
+
 async def run_raw_jsonrpc():
     """
     Main loop for the raw JSON-RPC stdio server.
 
     Reads newline-delimited JSON from stdin and writes responses to stdout.
-    Uses a thread-based stdin reader to avoid platform-specific asyncio pipe
-    issues (especially on Windows where connect_read_pipe is unreliable
+    On POSIX, stdin is read through an asyncio StreamReader so a batch of
+    back-to-back messages is drained from one buffered read. Elsewhere a
+    thread-based stdin reader is used to avoid platform-specific asyncio
+    pipe issues (especially on Windows where connect_read_pipe is unreliable
     with console handles).
     """
     logger.info("Starting Aider MCP server (raw JSON-RPC mode)")
 
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
+
+    reader = await _open_stdin_reader(loop)
 
     # Use a binary stdin handle for reliable cross-platform reading
     stdin_bin = sys.stdin.buffer
 
-    def _read_line_blocking() -> Optional[bytes]:
-        """Read a single line from stdin (blocking). Returns None on EOF."""
-        try:
-            line = stdin_bin.readline()
+    line_queue: "asyncio.Queue[Optional[bytes]]" = asyncio.Queue()
+
+    def _reader_thread() -> None:
+        """Forward stdin lines to the event loop; None marks EOF."""
+        while True:
+            try:
+                line = stdin_bin.readline()
+            except (OSError, ValueError):
+                line = b""
+            try:
+                loop.call_soon_threadsafe(line_queue.put_nowait, line or None)
+            except RuntimeError:  # loop already closed
+                return
             if not line:
-                return None
-            return line
-        except (OSError, ValueError):
-            return None
+                return
+
+    if reader is None:
+        # One long-lived reader thread rather than an executor job per line
+        threading.Thread(
+            target=_reader_thread, name="aider-mcp-stdin", daemon=True
+        ).start()
 
     logger.info("Aider MCP server ready -- waiting for JSON-RPC messages on stdin")
 
     while True:
         try:
-            # Read stdin in a thread so we don't block the event loop
-            raw_line = await loop.run_in_executor(None, _read_line_blocking)
+            if reader is not None:
+                raw_line = await reader.readline() or None
+            else:
+                raw_line = await line_queue.get()
             if raw_line is None:
                 logger.info("stdin closed -- shutting down")
                 break
 
-            line_str = raw_line.decode("utf-8", errors="replace").strip()
-            if not line_str:
+            # Parse the raw bytes directly; both parsers accept UTF-8 bytes
+            line = raw_line.strip()
+            if not line:
                 continue
 
             try:
-                msg = json.loads(line_str)
-            except json.JSONDecodeError as e:
+                msg = _json_loads(line)
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError; stdlib
+            # json raises UnicodeDecodeError for bytes that aren't UTF-8
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
                 error_resp = _make_error(None, PARSE_ERROR, f"JSON parse error: {e}")
                 _write_stdout(error_resp)
                 continue
 
+            # Keepalive pings skip dispatch and response encoding entirely
+            ping_line = _ping_fast_path(msg)
+            if ping_line is not None:
+                _write_stdout_bytes(ping_line)
+                continue
+
             response = await _handle_message(msg)
             if response is not None:
                 _write_stdout(response)
@@ -583,7 +961,7 @@ async def run_raw_jsonrpc():
             logger.info("Server cancelled -- shutting down")
             break
         except Exception as e:
-            logger.error(f"Unexpected error in main loop: {e}", exc_info=True)
+            logger.error("Unexpected error in main loop: %s", e, exc_info=True)
             try:
                 error_resp = _make_error(None, INTERNAL_ERROR_CODE, f"Server error: {e}")
                 _write_stdout(error_resp)
@@ -595,28 +973,52 @@ async def run_raw_jsonrpc():
 # Entry point
 # =========================================================================
 
+def _install_uvloop() -> None:
+    """Switch to uvloop's event loop policy when it is installed.
+
+    uvloop is optional (and unavailable on Windows); the default asyncio
+    loop is used otherwise.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("Using uvloop event loop")
+
+
 def main():
     """Start the Aider MCP server."""
-    logger.info(f"Aider MCP Server v{SERVER_VERSION}")
-    logger.info(f"Protocol version: {PROTOCOL_VERSION}")
-    logger.info(f"Bridge module: {aider_bridge.__file__}")
-    logger.info(f"FastMCP available: {_USE_FASTMCP}")
+    logger.info("Aider MCP Server v%s", SERVER_VERSION)
+    logger.info("Protocol version: %s", PROTOCOL_VERSION)
+    logger.info("Bridge module: %s", aider_bridge.__file__)
+    logger.info("FastMCP available: %s", _USE_FASTMCP)
 
     # Initialize the aider bridge eagerly so we log status at startup
     init_result = aider_bridge.init()
     if init_result["success"]:
         logger.info(
-            f"Aider bridge ready: {init_result['executable']} "
-            f"(v{init_result['version']})"
+            "Aider bridge ready: %s (v%s)",
+            init_result["executable"],
+            init_result["version"],
         )
     else:
         logger.warning(
-            f"Aider bridge init warning: {init_result['error']} "
-            "(tools will return errors until aider is installed)"
+            "Aider bridge init warning: %s "
+            "(tools will return errors until aider is installed)",
+            init_result["error"],
         )
 
-    if _USE_FASTMCP:
-        run_fastmcp()
+    # Both modes create their loop through the asyncio policy (FastMCP via
+    # anyio's asyncio backend), so uvloop applies to either
+    _install_uvloop()
+    # This process runs one loop in the main thread, so pidfd reaping is safe
+    aider_bridge.install_pidfd_child_watcher()
+
+    mcp_server = _load_fastmcp() if _USE_FASTMCP else None
+    if mcp_server is not None:
+        logger.info("Starting Aider MCP server (FastMCP mode)")
+        mcp_server.run()
     else:
         asyncio.run(run_raw_jsonrpc())
 
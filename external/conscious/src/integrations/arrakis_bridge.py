@@ -38,9 +38,16 @@ import json
 import logging
 import os
 import time
+import urllib.error
+import urllib.request
 from dataclasses import dataclass
 from typing import Any, Optional
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -79,6 +86,15 @@ ARRAKIS_BASE_URL: str = os.environ.get("ARRAKIS_URL", "http://localhost:8081")
 #: Default timeout for API calls (seconds)
 DEFAULT_API_TIMEOUT: float = 30.0
 
+#: Maximum pooled connections per bridge session
+SESSION_CONNECTION_LIMIT = 32
+
+#: Seconds an idle pooled connection is kept alive
+SESSION_KEEPALIVE_TIMEOUT: float = 60.0
+
+#: Seconds a health_check() result is reused before probing again
+HEALTH_TTL: float = 2.0
+
 #: Health-check endpoint path
 HEALTH_ENDPOINT = "/api/v1/health"
 
@@ -103,11 +119,12 @@ async def _api_call(
     *,
     timeout: float = DEFAULT_API_TIMEOUT,
     base_url: Optional[str] = None,
+    session: Optional["aiohttp.ClientSession"] = None,
 ) -> tuple[int, dict[str, Any]]:
     """Make an HTTP request to the Arrakis REST API.
 
-    Attempts aiohttp first; falls back to a curl subprocess if aiohttp
-    is not installed.
+    Uses aiohttp when installed; otherwise falls back to ``urllib`` run
+    in a worker thread.
 
     Args:
         method: HTTP method (GET, POST, PUT, DELETE).
@@ -115,6 +132,8 @@ async def _api_call(
         data: Optional JSON body for POST/PUT requests.
         timeout: Request timeout in seconds.
         base_url: Override the default Arrakis base URL.
+        session: Pooled aiohttp session to send the request on.  A
+            throwaway session is used when omitted.
 
     Returns:
         Tuple of (status_code, response_json_dict).
@@ -122,70 +141,65 @@ async def _api_call(
     """
     url = f"{base_url or ARRAKIS_BASE_URL}{path}"
 
-    # Try aiohttp
-    try:
-        import aiohttp
-        async with aiohttp.ClientSession() as session:
-            kwargs: dict[str, Any] = {
-                "timeout": aiohttp.ClientTimeout(total=timeout),
-            }
-            if data is not None:
-                kwargs["json"] = data
-
-            async with session.request(method, url, **kwargs) as resp:
-                try:
-                    body = await resp.json()
-                except Exception:
-                    body = {"raw": await resp.text()}
-                return resp.status, body
-
-    except ImportError:
-        pass  # fall through to curl
-    except (OSError, asyncio.TimeoutError) as exc:
-        return -1, {"error": f"Connection error: {exc}"}
+    if aiohttp is not None:
+        kwargs: dict[str, Any] = {
+            "timeout": aiohttp.ClientTimeout(total=timeout),
+        }
+        if data is not None:
+            kwargs["json"] = data
+
+        try:
+            if session is None:
+                async with aiohttp.ClientSession() as own_session:
+                    return await _send(own_session, method, url, kwargs)
+            return await _send(session, method, url, kwargs)
+        except (aiohttp.ClientError, OSError, asyncio.TimeoutError) as exc:
+            return -1, {"error": f"Connection error: {exc}"}
 
-    # Fallback: curl subprocess
-    cmd = ["curl", "-s", "-X", method, "-w", "\n%{http_code}"]
+    # Fallback: blocking urllib request on a worker thread
+    return await asyncio.to_thread(_urllib_call, method, url, data, timeout)
+
+
+async def _send(
+    session: "aiohttp.ClientSession",
+    method: str,
+    url: str,
+    kwargs: dict[str, Any],
+) -> tuple[int, dict[str, Any]]:
+    """Issue one request on *session* and decode the JSON (or raw) body."""
+    async with session.request(method, url, **kwargs) as resp:
+        try:
+            body = await resp.json()
+        except Exception:
+            body = {"raw": await resp.text()}
+        return resp.status, body
+
+
+def _urllib_call(
+    method: str,
+    url: str,
+    data: Optional[dict[str, Any]],
+    timeout: float,
+) -> tuple[int, dict[str, Any]]:
+    """Blocking ``urllib`` equivalent of the aiohttp path in ``_api_call``."""
+    request = urllib.request.Request(url, method=method)
     if data is not None:
-        cmd.extend([
-            "-H", "Content-Type: application/json",
-            "-d", json.dumps(data),
-        ])
-    cmd.append(url)
+        request.data = json.dumps(data).encode()
+        request.add_header("Content-Type", "application/json")
 
     try:
-        proc = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout_bytes, stderr_bytes = await asyncio.wait_for(
-            proc.communicate(), timeout=timeout
-        )
-    except asyncio.TimeoutError:
-        return -1, {"error": f"curl timed out after {timeout}s"}
-    except FileNotFoundError:
-        return -1, {"error": "curl not found on PATH"}
-
-    stdout = stdout_bytes.decode(errors="replace").strip()
-    if (proc.returncode or 0) != 0:
-        stderr = stderr_bytes.decode(errors="replace").strip()
-        return -1, {"error": stderr or f"curl exited with code {proc.returncode}"}
-
-    # Parse HTTP status code from the last line
-    lines = stdout.rsplit("\n", 1)
-    body_str = lines[0] if len(lines) > 1 else ""
-    try:
-        status_code = int(lines[-1]) if lines else -1
-    except ValueError:
-        status_code = -1
-        body_str = stdout
+        with urllib.request.urlopen(request, timeout=timeout) as resp:
+            status_code, raw = resp.status, resp.read()
+    except urllib.error.HTTPError as exc:
+        status_code, raw = exc.code, exc.read()
+    except OSError as exc:
+        return -1, {"error": f"Connection error: {exc}"}
 
+    text = raw.decode(errors="replace")
     try:
-        body = json.loads(body_str) if body_str else {}
+        body = json.loads(text) if text else {}
     except json.JSONDecodeError:
-        body = {"raw": body_str}
-
+        body = {"raw": text}
     return status_code, body
 
 
@@ -222,11 +236,55 @@ class ArrakisBridge:
         self._initialized = False
         self._healthy = False
         self._version: Optional[str] = None
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._health_cache: Optional[tuple[float, dict[str, Any]]] = None
 
     # ------------------------------------------------------------------
     # Lifecycle
     # ------------------------------------------------------------------
 
+    async def _get_session(self) -> Optional["aiohttp.ClientSession"]:
+        """Return the pooled HTTP session for the running event loop.
+
+        A session is bound to the loop that created it, so a new one is
+        made when the singleton bridge is reused under a later
+        ``asyncio.run``.
+
+        Returns:
+            The bridge's keep-alive aiohttp session, or None when aiohttp
+            is not installed.
+        """
+        if aiohttp is None:
+            return None
+        loop = asyncio.get_running_loop()
+        if (
+            self._session is None
+            or self._session.closed
+            or self._session_loop is not loop
+        ):
+            self._session_loop = loop
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=DEFAULT_API_TIMEOUT),
+                connector=aiohttp.TCPConnector(
+                    limit=SESSION_CONNECTION_LIMIT,
+                    keepalive_timeout=SESSION_KEEPALIVE_TIMEOUT,
+                ),
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP session.  Safe to call more than once."""
+        session = self._session
+        if (
+            session is not None
+            and not session.closed
+            and self._session_loop is asyncio.get_running_loop()
+        ):
+            await session.close()
+        self._session = None
+        self._session_loop = None
+
     async def init(self) -> dict[str, Any]:
         """Initialize the bridge by checking Arrakis connectivity.
 
@@ -236,6 +294,8 @@ class ArrakisBridge:
         Returns:
             Dictionary with initialization results.
         """
+        self._health_cache = None
+
         if self._initialized:
             return {
                 "success": True,
@@ -320,20 +380,37 @@ class ArrakisBridge:
     async def health_check(self) -> dict[str, Any]:
         """Check Arrakis server and microsandbox dependency availability.
 
+        Results are reused for ``HEALTH_TTL`` seconds so rapid status
+        polls do not hit the network each time.
+
         Returns:
             Dictionary with health-check results.
         """
+        cached = self._health_cache
+        if cached is not None and time.monotonic() - cached[0] < HEALTH_TTL:
+            return dict(cached[1])
+
         result: dict[str, Any] = {
             "healthy": False,
             "arrakis_reachable": False,
             "microsandbox_reachable": False,
         }
 
-        # 1. Check Arrakis itself
-        try:
-            status_code, body = await _api_call(
+        # Probe Arrakis and the microsandbox dependency concurrently
+        arrakis, msb_healthy = await asyncio.gather(
+            _api_call(
                 "GET", HEALTH_ENDPOINT, base_url=self._base_url, timeout=5,
-            )
+                session=await self._get_session(),
+            ),
+            self._microsandbox_healthy(),
+            return_exceptions=True,
+        )
+
+        # 1. Arrakis itself
+        if isinstance(arrakis, BaseException):
+            result["error"] = f"Failed to reach Arrakis: {arrakis}"
+        else:
+            status_code, body = arrakis
             if status_code == 200:
                 result["arrakis_reachable"] = True
                 result["version"] = body.get("version")
@@ -342,26 +419,27 @@ class ArrakisBridge:
                 result["error"] = body.get(
                     "error", f"Arrakis returned HTTP {status_code}"
                 )
-        except Exception as exc:
-            result["error"] = f"Failed to reach Arrakis: {exc}"
 
-        # 2. Check microsandbox dependency
+        # 2. Microsandbox dependency
+        result["microsandbox_reachable"] = msb_healthy is True
+
+        # Overall healthy only if Arrakis itself is reachable
+        result["healthy"] = result["arrakis_reachable"]
+        self._health_cache = (time.monotonic(), dict(result))
+        return result
+
+    @staticmethod
+    async def _microsandbox_healthy() -> bool:
+        """Return whether the microsandbox bridge reports itself healthy."""
         try:
-            from integrations.microsandbox_bridge import health_check as msb_health
             # Module-level convenience function is sync, but the bridge's
             # health_check is async -- use the bridge's singleton.
             from integrations.microsandbox_bridge import _get_bridge
-            msb_result = await _get_bridge().health_check()
-            result["microsandbox_reachable"] = msb_result.get("healthy", False)
         except ImportError:
-            result["microsandbox_reachable"] = False
             logger.debug("microsandbox_bridge not importable for health check")
-        except Exception:
-            result["microsandbox_reachable"] = False
-
-        # Overall healthy only if Arrakis itself is reachable
-        result["healthy"] = result["arrakis_reachable"]
-        return result
+            return False
+        msb_result = await _get_bridge().health_check()
+        return bool(msb_result.get("healthy", False))
 
     # ------------------------------------------------------------------
     # Snapshot operations
@@ -389,6 +467,7 @@ class ArrakisBridge:
         status_code, body = await _api_call(
             "POST", SNAPSHOT_PREFIX, data=payload,
             base_url=self._base_url,
+            session=await self._get_session(),
         )
 
         if status_code < 0 or status_code >= 400:
@@ -416,6 +495,7 @@ class ArrakisBridge:
         status_code, body = await _api_call(
             "POST", f"{SNAPSHOT_PREFIX}/{snapshot_id}/restore",
             base_url=self._base_url,
+            session=await self._get_session(),
         )
 
         if status_code < 0 or status_code >= 400:
@@ -441,6 +521,7 @@ class ArrakisBridge:
         status_code, body = await _api_call(
             "GET", f"{SNAPSHOT_PREFIX}?sandbox_id={sandbox_id}",
             base_url=self._base_url,
+            session=await self._get_session(),
         )
 
         if status_code < 0 or status_code >= 400:
@@ -469,6 +550,7 @@ class ArrakisBridge:
         status_code, body = await _api_call(
             "DELETE", f"{SNAPSHOT_PREFIX}/{snapshot_id}",
             base_url=self._base_url,
+            session=await self._get_session(),
         )
 
         if status_code < 0 or status_code >= 400:
@@ -510,6 +592,7 @@ class ArrakisBridge:
         status_code, body = await _api_call(
             "POST", f"{SANDBOX_PREFIX}/fork", data=payload,
             base_url=self._base_url,
+            session=await self._get_session(),
         )
 
         if status_code < 0 or status_code >= 400:
@@ -555,6 +638,7 @@ class ArrakisBridge:
         status_code, body = await _api_call(
             "POST", f"{REPLAY_PREFIX}/bundle", data=payload,
             base_url=self._base_url,
+            session=await self._get_session(),
         )
 
         if status_code < 0 or status_code >= 400:
@@ -693,6 +777,12 @@ async def init() -> dict[str, Any]:
     return await _get_bridge().init()
 
 
+async def aclose() -> None:
+    """Close the singleton bridge's HTTP session (module-level convenience)."""
+    if _bridge is not None:
+        await _bridge.aclose()
+
+
 def status() -> ToolStatus:
     """Return bridge health status (module-level convenience)."""
     return _get_bridge().status()
@@ -754,14 +844,12 @@ if __name__ == "__main__":
     )
     args = parser.parse_args()
 
-    async def _self_test() -> None:
+    async def _self_test(bridge: ArrakisBridge) -> None:
         """Run a self-test of the Arrakis bridge."""
         print("=" * 60)
         print("Arrakis Bridge Self-Test")
         print("=" * 60)
 
-        bridge = ArrakisBridge(base_url=args.url)
-
         # 1. Init
         print("\n[1/5] Initializing bridge...")
         result = await bridge.init()
@@ -839,4 +927,12 @@ if __name__ == "__main__":
         print("Self-test complete.")
         print("=" * 60)
 
-    asyncio.run(_self_test())
+    async def _run_self_test() -> None:
+        """Run the self-test and release the bridge's HTTP session."""
+        bridge = ArrakisBridge(base_url=args.url)
+        try:
+            await _self_test(bridge)
+        finally:
+            await bridge.aclose()
+
+    asyncio.run(_run_self_test())
@@ -76,6 +76,9 @@ class ToolRegistry:
             "file": "src/main.rs",
             "instruction": "Add error handling"
         })
+
+        # Close bridge HTTP sessions before the event loop exits
+        await registry.shutdown()
     """
 
     def __init__(self):
@@ -220,6 +223,21 @@ class ToolRegistry:
             logger.error(f"Error executing {tool_name}.{operation}: {e}")
             return {"error": str(e), "success": False}
 
+    async def shutdown(self) -> None:
+        """Release resources held by loaded bridges (HTTP sessions, etc.).
+
+        Calls each loaded bridge module's ``shutdown()`` or ``aclose()``
+        coroutine if it defines one.  Safe to call more than once.
+        """
+        for name, bridge in self._bridges.items():
+            close = getattr(bridge, "shutdown", None) or getattr(bridge, "aclose", None)
+            if close is None:
+                continue
+            try:
+                await close()
+            except Exception as e:
+                logger.warning(f"Error shutting down {name} bridge: {e}")
+
     def find_tools_for_capability(self, capability: str) -> list[ToolConfig]:
         """Find all tools that support a given capability."""
         return [
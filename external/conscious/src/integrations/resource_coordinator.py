@@ -107,6 +107,10 @@ TOOL_RESOURCES: dict[str, dict[str, list[ResourceRequirement]]] = {
         "auto_commit": [
             ResourceRequirement(ResourceId.REPO_WRITE, LockType.EXCLUSIVE),
         ],
+        "lint_and_fix": [
+            ResourceRequirement(ResourceId.REPO_WRITE, LockType.EXCLUSIVE),
+            ResourceRequirement(ResourceId.LLM_API, LockType.SEMAPHORE),
+        ],
     },
     "ast_grep": {
         "search": [ResourceRequirement(ResourceId.REPO_READ, LockType.SHARED_READ)],
@@ -259,9 +263,12 @@ class ReadWriteLock:
 
     async def acquire_write(self, holder: str = "", timeout: float = 30.0) -> bool:
         deadline = time.monotonic() + timeout
-        acquired = await asyncio.wait_for(
-            self._write_lock.acquire(), timeout=timeout
-        )
+        try:
+            acquired = await asyncio.wait_for(
+                self._write_lock.acquire(), timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            return False
         if not acquired:
             return False
         remaining = deadline - time.monotonic()